@@ -10,7 +10,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.database import Base
-from app.models import Form, Response
+from app.models import Form, FormVersion, Response, ResponseDailyStat
 from app.config import settings
 
 config = context.config
@@ -47,7 +47,7 @@ def do_run_migrations(connection: Connection) -> None:
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode."""
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL.replace('+asyncpg', '')
+    configuration["sqlalchemy.url"] = settings.DATABASE_URL
     
     connectable = async_engine_from_config(
         configuration,
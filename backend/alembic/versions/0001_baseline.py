@@ -0,0 +1,112 @@
+"""baseline schema
+
+Matches the schema that init_db() used to create with Base.metadata.create_all.
+Databases created that way can be adopted with `alembic stamp 0001_baseline`.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(notes, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, coalesce(tags, '[]'::jsonb), '[\"string\"]'), 'A') || "
+    "setweight(jsonb_to_tsvector('english'::regconfig, data, '[\"string\"]'), 'B')"
+)
+
+
+def upgrade() -> None:
+    response_status = postgresql.ENUM('DRAFT', 'SUBMITTED', 'REVIEWED', 'CLOSED', name='responsestatus')
+    response_priority = postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', 'URGENT', name='responsepriority')
+    response_status.create(op.get_bind(), checkfirst=True)
+    response_priority.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'forms',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('questions', postgresql.JSONB(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_forms_id', 'forms', ['id'])
+    op.create_index('ix_forms_is_active', 'forms', ['is_active'])
+
+    op.create_table(
+        'responses',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('form_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('data', postgresql.JSONB(), nullable=False),
+        sa.Column('reference_code', sa.String(length=20), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='responsestatus', create_type=False), nullable=False),
+        sa.Column('priority', postgresql.ENUM(name='responsepriority', create_type=False), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('tags', postgresql.JSONB(), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('reviewed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('reviewed_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('metadata', postgresql.JSONB(), nullable=True),
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['form_id'], ['forms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_responses_id', 'responses', ['id'])
+    op.create_index('ix_responses_form_id', 'responses', ['form_id'])
+    op.create_index('ix_responses_reference_code', 'responses', ['reference_code'], unique=True)
+    op.create_index('ix_responses_status', 'responses', ['status'])
+    op.create_index('ix_responses_priority', 'responses', ['priority'])
+    op.create_index('ix_responses_created_at', 'responses', ['created_at'])
+    op.create_index('ix_responses_created_at_id', 'responses', ['created_at', 'id'])
+    op.create_index('ix_responses_search_vector', 'responses', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_responses_data', 'responses', ['data'],
+        postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_responses_tags', 'responses', ['tags'],
+        postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'}
+    )
+
+    op.create_table(
+        'response_daily_stats',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('form_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='responsestatus', create_type=False), nullable=False),
+        sa.Column('priority', postgresql.ENUM(name='responsepriority', create_type=False), nullable=True),
+        sa.Column('count', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['form_id'], ['forms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_response_daily_stats_bucket', 'response_daily_stats',
+        ['form_id', 'day', 'status', 'priority'],
+        unique=True, postgresql_nulls_not_distinct=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('response_daily_stats')
+    op.drop_table('responses')
+    op.drop_table('forms')
+    postgresql.ENUM(name='responsepriority').drop(op.get_bind(), checkfirst=True)
+    postgresql.ENUM(name='responsestatus').drop(op.get_bind(), checkfirst=True)
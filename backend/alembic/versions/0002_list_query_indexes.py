@@ -0,0 +1,58 @@
+"""composite indexes for response list queries
+
+Replaces the single-column form_id, status and created_at indexes with
+indexes that match the filter + ORDER BY created_at DESC, id DESC shapes
+emitted by ResponseRepository.get_all and get_all_after, so those queries
+become ordered index scans with no bitmap merge or sort.
+
+Indexes are built CONCURRENTLY to avoid blocking writes on large tables.
+
+Revision ID: 0002_list_query_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_list_query_indexes'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_responses_form_created', 'responses',
+            ['form_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_responses_form_status_created', 'responses',
+            ['form_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_responses_submitted_created', 'responses',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text("status = 'SUBMITTED'"),
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_responses_form_id', table_name='responses', postgresql_concurrently=True)
+        op.drop_index('ix_responses_status', table_name='responses', postgresql_concurrently=True)
+        op.drop_index('ix_responses_created_at', table_name='responses', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_responses_created_at', 'responses', ['created_at'], postgresql_concurrently=True)
+        op.create_index('ix_responses_status', 'responses', ['status'], postgresql_concurrently=True)
+        op.create_index('ix_responses_form_id', 'responses', ['form_id'], postgresql_concurrently=True)
+        op.drop_index('ix_responses_submitted_created', table_name='responses', postgresql_concurrently=True)
+        op.drop_index('ix_responses_form_status_created', table_name='responses', postgresql_concurrently=True)
+        op.drop_index('ix_responses_form_created', table_name='responses', postgresql_concurrently=True)
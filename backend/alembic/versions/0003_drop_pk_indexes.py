@@ -0,0 +1,32 @@
+"""drop redundant indexes on primary keys
+
+forms.id and responses.id were declared with index=True on top of their
+primary keys, which already carry a unique index.
+
+Revision ID: 0003_drop_pk_indexes
+Revises: 0002_list_query_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_drop_pk_indexes'
+down_revision: Union[str, None] = '0002_list_query_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_responses_id', table_name='responses', postgresql_concurrently=True)
+        op.drop_index('ix_forms_id', table_name='forms', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_forms_id', 'forms', ['id'], postgresql_concurrently=True)
+        op.create_index('ix_responses_id', 'responses', ['id'], postgresql_concurrently=True)
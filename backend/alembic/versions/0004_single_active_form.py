@@ -0,0 +1,47 @@
+"""enforce a single active form
+
+Keeps the most recently created active form, deactivates any others, and
+replaces the plain is_active index with a partial exclusion constraint
+(is_active WITH =) WHERE is_active. The constraint is deferred to commit so
+an activation can flip both rows in a single UPDATE.
+
+Revision ID: 0004_single_active_form
+Revises: 0003_drop_pk_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_single_active_form'
+down_revision: Union[str, None] = '0003_drop_pk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE forms SET is_active = false
+        WHERE is_active
+          AND id <> (SELECT id FROM forms WHERE is_active ORDER BY created_at DESC LIMIT 1)
+        """
+    )
+    op.drop_index('ix_forms_is_active', table_name='forms')
+    op.create_exclude_constraint(
+        'ex_forms_single_active',
+        'forms',
+        ('is_active', '='),
+        where='is_active',
+        using='btree',
+        deferrable=True,
+        initially='DEFERRED',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_forms_single_active', 'forms')
+    op.create_index('ix_forms_is_active', 'forms', ['is_active'])
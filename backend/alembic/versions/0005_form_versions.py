@@ -0,0 +1,65 @@
+"""immutable form version snapshots
+
+Adds form_versions, snapshots every form at its current version, and makes
+responses reference the (form_id, version) they were submitted against.
+Existing responses are attributed to their form's current version, the only
+one that was ever stored.
+
+Revision ID: 0005_form_versions
+Revises: 0004_single_active_form
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_form_versions'
+down_revision: Union[str, None] = '0004_single_active_form'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'form_versions',
+        sa.Column('form_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('questions', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['form_id'], ['forms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('form_id', 'version'),
+    )
+    op.execute(
+        """
+        INSERT INTO form_versions (form_id, version, title, description, questions, created_at)
+        SELECT id, version, title, description, questions, updated_at FROM forms
+        """
+    )
+
+    op.add_column('responses', sa.Column('form_version', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE responses SET form_version = forms.version
+        FROM forms WHERE forms.id = responses.form_id
+        """
+    )
+    op.alter_column('responses', 'form_version', nullable=False)
+    op.create_foreign_key(
+        'responses_form_id_form_version_fkey',
+        'responses', 'form_versions',
+        ['form_id', 'form_version'], ['form_id', 'version'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('responses_form_id_form_version_fkey', 'responses', type_='foreignkey')
+    op.drop_column('responses', 'form_version')
+    op.drop_table('form_versions')
@@ -0,0 +1,70 @@
+from fastapi import FastAPI, Response
+import time
+from app.config import settings
+from app.database import engine
+from app.metrics import registry, instrument_engine
+
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code.",
+    ("method", "route", "status"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served, by method.",
+    ("method",),
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency and in-flight requests.
+    Requests are labelled by route template (/api/forms/{form_id}), never the
+    raw path, so ids do not create new series. Requests that never reach a
+    route (unknown paths, rate-limited requests) share the "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method)
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - started,
+                method,
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            )
+
+
+def setup_metrics(app: FastAPI) -> None:
+    """Instrument requests and the database engine, and serve them on /metrics."""
+    if not settings.METRICS_ENABLED:
+        return
+
+    instrument_engine(engine)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Metrics in the Prometheus text exposition format."""
+        return Response(content=registry.render(), media_type=registry.CONTENT_TYPE)
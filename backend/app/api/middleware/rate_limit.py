@@ -0,0 +1,185 @@
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+from typing import Dict, Optional, Tuple
+import logging
+import math
+import time
+import uuid
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-route limits in requests per minute, keyed by (method, path).
+# Routes not listed here are not rate limited.
+ROUTE_LIMITS: Dict[Tuple[str, str], int] = {
+    ("POST", "/api/responses"): settings.RATE_LIMIT_PER_MINUTE,
+    ("POST", "/api/responses/batch"): settings.RATE_LIMIT_BATCH_PER_MINUTE,
+}
+
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local member = ARGV[3]
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+
+
+class LocalTokenBucket:
+    """Per-process token buckets refilling at limit/60 tokens per second."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, list] = {}
+
+    def hit(self, key: str, limit: int) -> float:
+        """Take one token. Returns 0 if allowed, otherwise seconds until a token is available."""
+        now = time.monotonic()
+        rate = limit / 60.0
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            self._buckets[key] = [limit - 1.0, now, limit]
+            return 0.0
+
+        tokens = min(limit, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely; they carry no state."""
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * bucket[2] / 60.0 < bucket[2]
+        }
+        if len(self._buckets) >= self.max_keys:
+            self._buckets.clear()
+
+
+class RedisSlidingWindow:
+    """Atomic sliding-window log in Redis, shared by all workers."""
+
+    def __init__(self, client, window_ms: int = 60_000):
+        self.client = client
+        self.window_ms = window_ms
+        self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisSlidingWindow":
+        from redis import asyncio as aioredis
+
+        return cls(aioredis.from_url(url))
+
+    async def hit(self, key: str, limit: int) -> float:
+        """Record one request. Returns 0 if allowed, otherwise seconds until the window frees a slot."""
+        retry_ms = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[self.window_ms, limit, uuid.uuid4().hex]
+        )
+        return max(int(retry_ms), 0) / 1000.0
+
+
+class RateLimiter:
+    """
+    Local token bucket in front of an optional Redis sliding window.
+    A request the local bucket rejects is over the limit in this worker alone,
+    so only locally allowed requests pay for the Redis round trip.
+    """
+
+    def __init__(self, local: LocalTokenBucket, shared: Optional[RedisSlidingWindow] = None):
+        self.local = local
+        self.shared = shared
+
+    async def hit(self, key: str, limit: int) -> float:
+        retry_after = self.local.hit(key, limit)
+        if retry_after or self.shared is None:
+            return retry_after
+
+        try:
+            return await self.shared.hit(key, limit)
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, using local limit: {str(e)}")
+            return 0.0
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing ROUTE_LIMITS per client address."""
+
+    def __init__(self, app, limiter: RateLimiter, route_limits: Dict[Tuple[str, str], int]):
+        self.app = app
+        self.limiter = limiter
+        self.route_limits = route_limits
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"].rstrip("/") or "/"
+        limit = self.route_limits.get((method, path))
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = await self.limiter.hit(f"{method}:{path}:{self._client_id(scope)}", limit)
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                'success': False,
+                'error': 'Too Many Requests',
+                'detail': f'Rate limit of {limit} requests per minute exceeded'
+            },
+            headers={
+                'Retry-After': str(math.ceil(retry_after)),
+                'X-RateLimit-Limit': str(limit),
+            }
+        )
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _client_id(scope) -> str:
+        if settings.RATE_LIMIT_TRUST_PROXY:
+            for name, value in scope.get("headers", []):
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Create the limiter for RATE_LIMIT_BACKEND (local or redis)."""
+    shared = None
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        shared = RedisSlidingWindow.from_url(settings.REDIS_URL)
+    return RateLimiter(LocalTokenBucket(), shared)
+
+
+def setup_rate_limit(app: FastAPI) -> None:
+    """Configure rate limiting middleware."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=create_rate_limiter(),
+        route_limits=ROUTE_LIMITS,
+    )
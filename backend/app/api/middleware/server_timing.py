@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+import time
+from app.config import settings
+from app.database import engine
+from app.metrics import track_queries, track_engine_queries
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware adding a Server-Timing header with the request's database
+    round trips, e.g. `db;desc="4 queries";dur=3.1, app;dur=7.9`.
+    Statements executed after the response starts (streamed bodies) are not included.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    total_ms = (time.perf_counter() - started) * 1000
+                    timing = (
+                        f'db;desc="{stats.count} queries";dur={stats.duration * 1000:.1f}, '
+                        f'app;dur={total_ms:.1f}'
+                    )
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode("latin-1"))]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def setup_server_timing(app: FastAPI) -> None:
+    """Report per-request query counts in a Server-Timing header (debug mode only)."""
+    if not settings.DEBUG:
+        return
+
+    track_engine_queries(engine)
+    app.add_middleware(ServerTimingMiddleware)
@@ -0,0 +1,14 @@
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """
+    JSON response rendered straight from a Pydantic model with model_dump_json.
+    Skips FastAPI's response_model validation and the jsonable_encoder pass,
+    so use it only with a model that already has the declared response type.
+    """
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
-from app.api.routes import forms, responses, health
+from app.api.routes import forms, responses, jobs, health
 
 api_router = APIRouter(prefix="/api")
 
 api_router.include_router(forms.router)
 api_router.include_router(responses.router)
+api_router.include_router(jobs.router)
 api_router.include_router(health.router)
 
 __all__ = ["api_router"]
\ No newline at end of file
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 from app.database import get_db
 from app.services import FormService
@@ -8,10 +8,16 @@ from app.schemas import (
     FormCreate,
     FormUpdate,
     FormResponse,
+    FormVersionResponse,
     FormListItem,
     PaginatedResponse,
-    SuccessResponse
+    CountMode,
+    SuccessResponse,
+    JobResponse
 )
+from app.utils.helpers import etag_matches
+from app.api.rendering import ModelJSONResponse
+from app.tasks import job_backend
 
 router = APIRouter(prefix="/forms", tags=["forms"])
 
@@ -27,10 +33,16 @@ async def create_form(
 
 
 @router.get("/active", response_model=FormResponse)
-async def get_active_form(db: AsyncSession = Depends(get_db)):
-    """Get the currently active form."""
+async def get_active_form(request: Request, db: AsyncSession = Depends(get_db)):
+    """Get the currently active form. Supports If-None-Match for 304 responses."""
     service = FormService(db)
-    return await service.get_active_form()
+    cached = await service.get_active_form_cached()
+    
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
 @router.get("", response_model=PaginatedResponse[FormListItem])
@@ -38,11 +50,12 @@ async def get_all_forms(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     is_active: Optional[bool] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all forms with pagination."""
     service = FormService(db)
-    return await service.get_all_forms(page, page_size, is_active)
+    return ModelJSONResponse(await service.get_all_forms(page, page_size, is_active, count))
 
 
 @router.get("/{form_id}", response_model=FormResponse)
@@ -55,6 +68,24 @@ async def get_form(
     return await service.get_form(form_id)
 
 
+@router.get("/{form_id}/versions/{version}", response_model=FormVersionResponse)
+async def get_form_version(
+    form_id: UUID,
+    version: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get an immutable snapshot of a form version. Responses reference the version they were submitted against."""
+    service = FormService(db)
+    cached = await service.get_form_version(form_id, version)
+    
+    headers = {"ETag": cached.etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
 @router.patch("/{form_id}", response_model=FormResponse)
 async def update_form(
     form_id: UUID,
@@ -66,13 +97,23 @@ async def update_form(
     return await service.update_form(form_id, form_data)
 
 
-@router.delete("/{form_id}", response_model=SuccessResponse)
+@router.delete("/{form_id}", response_model=Union[SuccessResponse, JobResponse])
 async def delete_form(
     form_id: UUID,
+    response: Response,
+    background: bool = Query(False, description="Delete in a background job and return 202"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Delete a form."""
+    """
+    Delete a form together with its versions and responses.
+    Large forms can be deleted with background=true; poll GET /api/jobs/{id}.
+    """
     service = FormService(db)
+    if background:
+        await service.get_form(form_id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await job_backend.submit("delete_form", {'form_id': str(form_id)})
+    
     await service.delete_form(form_id)
     return SuccessResponse(message="Form deleted successfully")
 
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+import os
+from app.schemas import JobState, JobResponse
+from app.tasks import job_backend, export_path
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+async def get_job_or_404(job_id: str) -> JobResponse:
+    job = await job_backend.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Get the state of a background job; poll until it has succeeded or failed."""
+    return await get_job_or_404(job_id)
+
+
+@router.get("/{job_id}/download")
+async def download_job_result(job_id: str):
+    """Download the file written by a finished export job."""
+    job = await get_job_or_404(job_id)
+    filename = (job.result or {}).get('filename')
+    if job.state != JobState.SUCCEEDED or not filename:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job has no file to download"
+        )
+
+    path = export_path(filename)
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file is no longer available"
+        )
+
+    media_type = "text/csv" if job.result.get('format') == "csv" else "application/x-ndjson"
+    return FileResponse(path, media_type=media_type, filename=f"responses.{job.result.get('format')}")
@@ -1,23 +1,51 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from uuid import UUID
-from app.database import get_db
+from typing import Optional, List
+from uuid import UUID, uuid4
+from datetime import datetime
+from app.database import get_db, AsyncSessionLocal
 from app.services import ResponseService
+from app.tasks import job_backend
+from app.api.rendering import ModelJSONResponse
 from app.schemas import (
     ResponseCreate,
+    ResponseBatchCreate,
+    ResponseBatchResult,
     ResponseUpdate,
     ResponseResponse,
     ResponseListItem,
     ResponseFilter,
+    ExportFormat,
+    StatsInterval,
     PaginatedResponse,
-    SuccessResponse
+    PaginationMode,
+    CountMode,
+    SuccessResponse,
+    JobResponse
 )
 from app.models import ResponseStatus, ResponsePriority
 
 router = APIRouter(prefix="/responses", tags=["responses"])
 
 
+def parse_answer_filters(answers: Optional[List[str]]) -> Optional[dict]:
+    """Parse repeated question_id:value query parameters into an answers filter."""
+    if not answers:
+        return None
+    
+    parsed = {}
+    for item in answers:
+        question_id, separator, value = item.partition(':')
+        if not separator or not question_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid answer filter '{item}', expected question_id:value"
+            )
+        parsed[question_id] = value
+    return parsed
+
+
 @router.post("", response_model=ResponseResponse, status_code=status.HTTP_201_CREATED)
 async def create_response(
     response_data: ResponseCreate,
@@ -28,6 +56,16 @@ async def create_response(
     return await service.create_response(response_data)
 
 
+@router.post("/batch", response_model=ResponseBatchResult)
+async def create_responses_batch(
+    batch: ResponseBatchCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many responses at once, reporting success or failure per item."""
+    service = ResponseService(db)
+    return ModelJSONResponse(await service.create_responses_batch(batch))
+
+
 @router.get("", response_model=PaginatedResponse[ResponseListItem])
 async def get_all_responses(
     page: int = Query(1, ge=1),
@@ -36,17 +74,31 @@ async def get_all_responses(
     priority: Optional[ResponsePriority] = Query(None),
     form_id: Optional[UUID] = Query(None),
     search: Optional[str] = Query(None),
+    answer: Optional[List[str]] = Query(None, description="question_id:value, repeatable"),
+    tag: Optional[List[str]] = Query(None, description="Repeatable; all tags must match"),
+    pagination: PaginationMode = Query(PaginationMode.OFFSET),
+    cursor: Optional[str] = Query(None),
+    count: Optional[CountMode] = Query(None, description="Default: exact for offset paging, none for cursor paging"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all responses with pagination and filters."""
+    """
+    Get all responses with pagination and filters.
+    Pass pagination=cursor (or a cursor token) for keyset paging; follow next_cursor for later pages.
+    count=estimated uses planner statistics and count=none skips the total, reporting has_next only.
+    Cursor paging defaults to count=none so deep pages do not pay for a COUNT each time.
+    """
     filters = ResponseFilter(
         status=status_filter,
         priority=priority,
         form_id=form_id,
-        search=search
+        search=search,
+        answers=parse_answer_filters(answer),
+        tags=tag
     )
     service = ResponseService(db)
-    return await service.get_all_responses(page, page_size, filters)
+    if cursor or pagination == PaginationMode.CURSOR:
+        return ModelJSONResponse(await service.get_responses_after(cursor, page_size, filters, count or CountMode.NONE))
+    return ModelJSONResponse(await service.get_all_responses(page, page_size, filters, count or CountMode.EXACT))
 
 
 @router.get("/reference/{reference_code}", response_model=ResponseResponse)
@@ -62,11 +114,102 @@ async def get_response_by_reference(
 @router.get("/stats")
 async def get_response_stats(
     form_id: Optional[UUID] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    interval: Optional[StatsInterval] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get response statistics."""
+    """Get response statistics, optionally bucketed per day or week of created_at."""
     service = ResponseService(db)
-    return await service.get_response_stats(form_id)
+    return await service.get_response_stats(form_id, date_from, date_to, interval)
+
+
+@router.post("/stats/rebuild", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_response_stats():
+    """Rebuild the daily statistics counters in the background. Poll GET /api/jobs/{id}."""
+    return await job_backend.submit("rebuild_stats", {})
+
+
+async def get_export_question_ids(
+    export_format: ExportFormat,
+    form_id: Optional[UUID],
+    db: AsyncSession
+) -> Optional[List[str]]:
+    """Resolve the per-question CSV columns; CSV exports require form_id."""
+    if export_format != ExportFormat.CSV:
+        return None
+    if not form_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="form_id is required for CSV export"
+        )
+    return await ResponseService(db).get_export_question_ids(form_id)
+
+
+@router.get("/export")
+async def export_responses(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    form_id: Optional[UUID] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    status_filter: Optional[ResponseStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Export responses as CSV or NDJSON.
+    CSV requires form_id and adds one column per form question.
+    """
+    question_ids = await get_export_question_ids(export_format, form_id, db)
+    
+    filters = ResponseFilter(
+        status=status_filter,
+        form_id=form_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    
+    async def stream():
+        # The request session closes before the body is sent, so the cursor gets its own.
+        async with AsyncSessionLocal() as session:
+            service = ResponseService(session)
+            async for chunk in service.export_responses(export_format, filters, question_ids):
+                yield chunk
+    
+    media_type = "text/csv" if export_format == ExportFormat.CSV else "application/x-ndjson"
+    filename = f"responses.{export_format.value}"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/export/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def export_responses_job(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    form_id: Optional[UUID] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    status_filter: Optional[ResponseStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Export responses to a file in the background, with the same parameters as GET /export.
+    Poll GET /api/jobs/{id}, then fetch the file from GET /api/jobs/{id}/download.
+    """
+    question_ids = await get_export_question_ids(export_format, form_id, db)
+    filters = ResponseFilter(
+        status=status_filter,
+        form_id=form_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    return await job_backend.submit("export_responses", {
+        'filename': f"responses-{uuid4().hex}.{export_format.value}",
+        'export_format': export_format.value,
+        'filters': filters.model_dump(mode="json", exclude_none=True),
+        'question_ids': question_ids,
+    })
 
 
 @router.get("/{response_id}", response_model=ResponseResponse)
@@ -0,0 +1,21 @@
+from app.cache.active_form import ActiveFormCache, CachedForm, active_form_cache
+from app.cache.answer_validator import AnswerValidatorCache, answer_validator_cache
+from app.cache.backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend, create_cache_backend
+from app.cache.form_cache import FormCache, form_cache
+from app.cache.form_version import FormVersionCache, form_version_cache
+
+__all__ = [
+    "ActiveFormCache",
+    "CachedForm",
+    "active_form_cache",
+    "AnswerValidatorCache",
+    "answer_validator_cache",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "create_cache_backend",
+    "FormCache",
+    "form_cache",
+    "FormVersionCache",
+    "form_version_cache",
+]
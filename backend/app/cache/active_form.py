@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import hashlib
+import time
+from app.config import settings
+from app.schemas import FormResponse
+
+
+@dataclass(frozen=True)
+class CachedForm:
+    body: bytes
+    etag: str
+
+
+class ActiveFormCache:
+    """
+    Process-local cache of the serialized active form.
+    Entries are tagged with a version; any form mutation bumps the version,
+    and writes carrying an older version are dropped. Entries also expire
+    after ttl_seconds, which bounds staleness when an invalidation from
+    another worker cannot reach this process (memory cache backend).
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._version = 0
+        self._entry: Optional[Tuple[int, float, CachedForm]] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self) -> Optional[CachedForm]:
+        entry = self._entry
+        if entry is not None and entry[0] == self._version and entry[1] > time.monotonic():
+            return entry[2]
+        return None
+
+    def set(self, version: int, form: FormResponse) -> CachedForm:
+        """Serialize a form and cache it if no mutation happened since `version` was read."""
+        body = form.model_dump_json().encode("utf-8")
+        cached = CachedForm(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+        if version == self._version and self.ttl_seconds > 0:
+            self._entry = (version, time.monotonic() + self.ttl_seconds, cached)
+        return cached
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._entry = None
+
+
+active_form_cache = ActiveFormCache(settings.CACHE_TTL_SECONDS)
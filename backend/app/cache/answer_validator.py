@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+from app.config import settings
+from app.schemas import FormQuestionSchema
+from app.utils.answers import AnswerValidator
+
+
+class AnswerValidatorCache:
+    """
+    Process-local LRU of compiled answer validators keyed by (form_id, version).
+    Form versions are immutable, so entries are never invalidated, only evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[UUID, int], AnswerValidator]" = OrderedDict()
+
+    def get(self, form_id: UUID, version: int) -> Optional[AnswerValidator]:
+        validator = self._entries.get((form_id, version))
+        if validator is not None:
+            self._entries.move_to_end((form_id, version))
+        return validator
+
+    def compile(self, form_id: UUID, version: int, questions: Sequence[FormQuestionSchema]) -> AnswerValidator:
+        """Build the validator for a form version and cache it."""
+        validator = AnswerValidator(questions)
+        self._entries[(form_id, version)] = validator
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return validator
+
+
+answer_validator_cache = AnswerValidatorCache(settings.CACHE_MAX_ENTRIES)
@@ -0,0 +1,176 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str], None]
+
+
+class CacheBackend:
+    """Interface shared by the cache backends."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def publish(self, channel: str, message: str) -> None:
+        raise NotImplementedError
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache with per-key TTL.
+    Pub/sub is delivered to handlers in the same process only.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+            self._counters.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def publish(self, channel: str, message: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            handler(message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._handlers.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis cache shared by all workers, with pub/sub delivered by a background listener."""
+
+    def __init__(self, client):
+        self.client = client
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        from redis import asyncio as aioredis
+
+        return cls(aioredis.from_url(url))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ttl or None)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self.client.publish(channel, message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        if self._pubsub is None:
+            self._pubsub = self.client.pubsub()
+        self._handlers.setdefault(channel, []).append(handler)
+        await self._pubsub.subscribe(channel)
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    channel = message["channel"]
+                    data = message["data"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    for handler in self._handlers.get(channel, []):
+                        handler(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # redis-py re-subscribes known channels when the connection is re-established.
+                logger.warning(f"Cache pub/sub listener error, reconnecting: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        await self.client.aclose()
+
+
+def create_cache_backend(backend: Optional[str] = None) -> CacheBackend:
+    """Create the cache backend named by CACHE_BACKEND (memory, redis or fakeredis)."""
+    backend = (backend or settings.CACHE_BACKEND).lower()
+
+    if backend == "redis":
+        return RedisCacheBackend.from_url(settings.REDIS_URL)
+
+    if backend == "fakeredis":
+        try:
+            from fakeredis import aioredis as fake_aioredis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=fakeredis requires the fakeredis package") from e
+        return RedisCacheBackend(fake_aioredis.FakeRedis())
+
+    if backend == "memory":
+        return MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+    raise ValueError(f"Unknown cache backend: {backend}")
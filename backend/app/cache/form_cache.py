@@ -0,0 +1,101 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Set
+import asyncio
+import logging
+from app.config import settings
+from app.cache.backends import CacheBackend, create_cache_backend
+from app.cache.active_form import active_form_cache
+
+logger = logging.getLogger(__name__)
+
+
+class FormCache:
+    """
+    Shared cache for form reads.
+    Keys are scoped by a generation number kept in the backend. A mutation
+    increments the generation and publishes it, so every worker switches to
+    fresh keys and drops its process-local active form entry; entries for old
+    generations simply expire.
+    """
+
+    PREFIX = "cache:forms"
+    GENERATION_KEY = "cache:forms:generation"
+    CHANNEL = "cache:forms:invalidate"
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._pending: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Load the current generation and subscribe to invalidations."""
+        try:
+            value = await self.backend.get(self.GENERATION_KEY)
+            self._apply_generation(int(value or 0))
+            await self.backend.subscribe(self.CHANNEL, self._on_message)
+        except Exception as e:
+            logger.warning(f"Form cache unavailable at startup: {str(e)}")
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    async def drain(self) -> None:
+        """Wait for post-commit invalidations; used where the event loop does not keep running."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def key(self, *parts: object) -> str:
+        return ":".join([self.PREFIX, str(self.generation), *(str(part) for part in parts)])
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Form cache read failed: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Form cache write failed: {str(e)}")
+
+    async def invalidate(self) -> None:
+        """Start a new generation and notify the other workers."""
+        active_form_cache.invalidate()
+        try:
+            generation = await self.backend.incr(self.GENERATION_KEY)
+            self._apply_generation(generation)
+            await self.backend.publish(self.CHANNEL, str(generation))
+        except Exception as e:
+            logger.warning(f"Form cache invalidation failed: {str(e)}")
+
+    async def invalidate_on_commit(self, db: AsyncSession) -> None:
+        """
+        Invalidate now and again once the session commits, so readers that
+        saw pre-commit data cannot repopulate the cache with it.
+        """
+        await self.invalidate()
+        event.listen(db.sync_session, "after_commit", self._schedule_invalidate, once=True)
+
+    def _schedule_invalidate(self, session) -> None:
+        active_form_cache.invalidate()
+        task = asyncio.get_running_loop().create_task(self.invalidate())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _on_message(self, message: str) -> None:
+        try:
+            self._apply_generation(int(message))
+        except ValueError:
+            logger.warning(f"Ignoring malformed form cache invalidation: {message}")
+
+    def _apply_generation(self, generation: int) -> None:
+        if generation > self.generation:
+            self.generation = generation
+            active_form_cache.invalidate()
+
+
+form_cache = FormCache(create_cache_backend(), settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+from app.cache.active_form import CachedForm
+from app.config import settings
+from app.schemas import FormVersionResponse
+
+
+class FormVersionCache:
+    """
+    Process-local LRU of serialized form version snapshots.
+    Snapshots are immutable, so entries are never invalidated, only evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[UUID, int], CachedForm]" = OrderedDict()
+
+    def get(self, form_id: UUID, version: int) -> Optional[CachedForm]:
+        cached = self._entries.get((form_id, version))
+        if cached is not None:
+            self._entries.move_to_end((form_id, version))
+        return cached
+
+    def set(self, snapshot: FormVersionResponse) -> CachedForm:
+        """Serialize a snapshot and cache it. The ETag is derived from (form_id, version)."""
+        cached = CachedForm(
+            body=snapshot.model_dump_json().encode("utf-8"),
+            etag=f'"{snapshot.form_id}.{snapshot.version}"'
+        )
+        self._entries[(snapshot.form_id, snapshot.version)] = cached
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return cached
+
+
+form_version_cache = FormVersionCache(settings.CACHE_MAX_ENTRIES)
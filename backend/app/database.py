@@ -1,12 +1,21 @@
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import Optional
+import os
 from app.config import settings
+from app.metrics import InstrumentedQueuePool
+
+ALEMBIC_SCRIPT_LOCATION = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic")
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     future=True,
     pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool if settings.METRICS_ENABLED else AsyncAdaptedQueuePool,
     pool_size=10,
     max_overflow=20,
 )
@@ -34,9 +43,34 @@ async def get_db():
             await session.close()
 
 
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def get_head_revision() -> Optional[str]:
+    """Return the head revision of the Alembic migration scripts."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", ALEMBIC_SCRIPT_LOCATION)
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+async def check_schema_version():
+    """
+    Verify the database is migrated to the head Alembic revision.
+    Schema changes are applied with `alembic upgrade head`, never at startup;
+    this only reads alembic_version, so worker boot does not reflect the schema.
+    """
+    expected = get_head_revision()
+    try:
+        async with engine.connect() as conn:
+            current = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+    except ProgrammingError:
+        current = None
+
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, expected {expected}. "
+            "Run `alembic upgrade head` before starting the application."
+        )
 
 
 async def close_db():
@@ -1,11 +1,17 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 from app.config import settings
-from app.database import init_db, close_db
+from app.database import check_schema_version, close_db
+from app.cache import form_cache
+from app.tasks import job_backend
 from app.api.routes import api_router
 from app.api.middleware.cors import setup_cors
 from app.api.middleware.error_handler import setup_error_handlers
+from app.api.middleware.rate_limit import setup_rate_limit
+from app.api.middleware.metrics import setup_metrics
+from app.api.middleware.server_timing import setup_server_timing
 
 logging.basicConfig(
     level=logging.INFO if settings.DEBUG else logging.WARNING,
@@ -19,10 +25,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting application...")
-    await init_db()
-    logger.info("Database initialized")
+    if settings.DATABASE_SCHEMA_CHECK:
+        await check_schema_version()
+        logger.info("Database schema is up to date")
+    await form_cache.start()
     yield
     logger.info("Shutting down application...")
+    await job_backend.close()
+    await form_cache.close()
     await close_db()
     logger.info("Database connections closed")
 
@@ -33,11 +43,15 @@ app = FastAPI(
     description="MeYouSafe - Anonymous Reporting Platform API",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+setup_rate_limit(app)
 setup_cors(app)
 setup_error_handlers(app)
+setup_server_timing(app)
+setup_metrics(app)
 
 app.include_router(api_router)
 
@@ -0,0 +1,17 @@
+from app.metrics.registry import Counter, Gauge, Histogram, Registry, registry
+from app.metrics.database import InstrumentedQueuePool, instrument_engine, statement_operation
+from app.metrics.queries import QueryStats, track_queries, track_engine_queries
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "registry",
+    "InstrumentedQueuePool",
+    "instrument_engine",
+    "statement_operation",
+    "QueryStats",
+    "track_queries",
+    "track_engine_queries",
+]
@@ -0,0 +1,80 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+import time
+from app.metrics.registry import registry
+
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# Statements are labelled by their leading keyword (SELECT, INSERT, WITH, ...)
+# rather than their text, which keeps the label set small and free of literals.
+db_statement_seconds = registry.histogram(
+    "db_statement_duration_seconds",
+    "Database statement execution time by statement type.",
+    ("operation",),
+)
+db_statement_errors = registry.counter(
+    "db_statement_errors_total",
+    "Database statements that raised an error, by statement type.",
+    ("operation",),
+)
+db_pool_checkout_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection, including opening new ones.",
+    buckets=POOL_WAIT_BUCKETS,
+)
+
+
+def statement_operation(statement: str) -> str:
+    """Return the leading SQL keyword of a statement, upper-cased."""
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement on the engine and expose its pool occupancy as gauges."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["metrics_started"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("metrics_started", None)
+        if started is not None:
+            db_statement_seconds.observe(time.perf_counter() - started, statement_operation(statement))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None:
+            conn.info.pop("metrics_started", None)
+        db_statement_errors.inc(statement_operation(exception_context.statement or ""))
+
+    def pool_state():
+        pool = sync_engine.pool
+        return {
+            ("size",): pool.size(),
+            ("checked_out",): pool.checkedout(),
+            ("checked_in",): pool.checkedin(),
+            ("overflow",): max(pool.overflow(), 0),
+        }
+
+    registry.gauge(
+        "db_pool_connections",
+        "Connection pool occupancy: configured size, checked out, idle and overflow.",
+        ("state",),
+        collect=pool_state,
+    )
@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+import time
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one tracked scope, usually one request."""
+    count: int = 0
+    duration: float = 0.0
+    statements: List[str] = field(default_factory=list)
+    keep_statements: bool = False
+    parent: Optional["QueryStats"] = None
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record a statement here and in every enclosing scope."""
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            if stats.keep_statements:
+                stats.statements.append(statement)
+            stats = stats.parent
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """
+    Count the statements executed by the current task (and tasks it starts)
+    until the block exits. Nested scopes also count towards the enclosing ones.
+    Requires track_engine_queries() on the engine.
+    """
+    stats = QueryStats(keep_statements=keep_statements, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    stats = _current_stats.get()
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def track_engine_queries(engine: AsyncEngine) -> None:
+    """Report the engine's statements to the QueryStats of the running context, if any."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
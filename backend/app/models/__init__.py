@@ -1,4 +1,6 @@
 from app.models.form import Form
+from app.models.form_version import FormVersion
 from app.models.response import Response, ResponseStatus, ResponsePriority
+from app.models.response_stats import ResponseDailyStat
 
-__all__ = ["Form", "Response", "ResponseStatus", "ResponsePriority"]
\ No newline at end of file
+__all__ = ["Form", "FormVersion", "Response", "ResponseStatus", "ResponsePriority", "ResponseDailyStat"]
\ No newline at end of file
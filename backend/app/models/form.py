@@ -1,18 +1,30 @@
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, JSON, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.sql import func
 import uuid
 from app.database import Base
+from app.models.types import JSONType
 
 
 class Form(Base):
     __tablename__ = "forms"
+    __table_args__ = (
+        # At most one active form. Checked at commit so a swap may update both rows in either order.
+        ExcludeConstraint(
+            ("is_active", "="),
+            name="ex_forms_single_active",
+            using="btree",
+            where=text("is_active"),
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    questions = Column(JSON, nullable=False, default=list)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    questions = Column(JSONType, nullable=False, default=list)
+    is_active = Column(Boolean, default=True, nullable=False)
     version = Column(Integer, default=1, nullable=False)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+from app.models.types import JSONType
+
+
+class FormVersion(Base):
+    """Immutable snapshot of a form's content. Rows are only ever inserted."""
+    __tablename__ = "form_versions"
+
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    questions = Column(JSONType, nullable=False, default=list)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<FormVersion(form_id={self.form_id}, version={self.version})>"
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, String, DateTime, JSON, Text, Enum as SQLEnum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, DateTime, Text, Enum as SQLEnum, ForeignKey, ForeignKeyConstraint, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 import enum
 from app.database import Base
+from app.models.types import JSONType
 
 
 class ResponseStatus(str, enum.Enum):
@@ -21,28 +22,61 @@ class ResponsePriority(str, enum.Enum):
     URGENT = "urgent"
 
 
+SEARCH_CONFIG = "english"
+
+# Full-text document: notes and tags weighted A, string answers in data weighted B.
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(notes, '')), 'A') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(tags, '[]'::jsonb), '[\"string\"]'), 'A') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}'::regconfig, data, '[\"string\"]'), 'B')"
+)
+
+
 class Response(Base):
     __tablename__ = "responses"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["form_id", "form_version"],
+            ["form_versions.form_id", "form_versions.version"],
+            ondelete="CASCADE",
+        ),
+        Index("ix_responses_created_at_id", "created_at", "id"),
+        # List queries filter by form/status and order by created_at DESC, id DESC.
+        Index("ix_responses_form_created", "form_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_responses_form_status_created", "form_id", "status", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_responses_submitted_created", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("status = 'SUBMITTED'"),
+        ),
+        Index("ix_responses_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_responses_data", "data", postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}),
+        Index("ix_responses_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False)
+    form_version = Column(Integer, nullable=False)
     
-    data = Column(JSON, nullable=False, default=dict)
+    data = Column(JSONType, nullable=False, default=dict)
     reference_code = Column(String(20), unique=True, nullable=False, index=True)
     
-    status = Column(SQLEnum(ResponseStatus), default=ResponseStatus.SUBMITTED, nullable=False, index=True)
+    status = Column(SQLEnum(ResponseStatus), default=ResponseStatus.SUBMITTED, nullable=False)
     priority = Column(SQLEnum(ResponsePriority), default=ResponsePriority.MEDIUM, nullable=True, index=True)
     
     notes = Column(Text, nullable=True)
-    tags = Column(JSON, nullable=True, default=list)
+    tags = Column(JSONType, nullable=True, default=list)
     
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
     reviewed_by = Column(UUID(as_uuid=True), nullable=True)
     
-    metadata = Column(JSON, nullable=True, default=dict)
+    # "metadata" is reserved on declarative classes, so the attribute is metadata_.
+    metadata_ = Column("metadata", JSONType, nullable=True, default=dict)
+    
+    # Only used in SQL (filters and ranking), so never loaded with the row.
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True))
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     def __repr__(self):
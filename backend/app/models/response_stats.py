@@ -0,0 +1,27 @@
+from sqlalchemy import Column, BigInteger, Date, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+from app.models.response import ResponseStatus, ResponsePriority
+
+
+class ResponseDailyStat(Base):
+    """Incrementally maintained response counters per form, status, priority and UTC day."""
+    __tablename__ = "response_daily_stats"
+    __table_args__ = (
+        Index(
+            "uq_response_daily_stats_bucket",
+            "form_id", "day", "status", "priority",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    status = Column(SQLEnum(ResponseStatus), nullable=False)
+    priority = Column(SQLEnum(ResponsePriority), nullable=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ResponseDailyStat(form_id={self.form_id}, day={self.day}, status={self.status}, priority={self.priority}, count={self.count})>"
@@ -0,0 +1,5 @@
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSONB on Postgres (containment operators, GIN indexes); plain JSON elsewhere, e.g. SQLite in tests.
+JSONType = JSONB().with_variant(JSON(), "sqlite")
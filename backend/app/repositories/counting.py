@@ -0,0 +1,126 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from typing import Optional, Dict, Tuple
+import json
+import time
+import logging
+from app.config import settings
+from app.schemas import CountMode
+
+logger = logging.getLogger(__name__)
+
+
+class CountCache:
+    """Process-local TTL cache of exact counts, keyed by query signature."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, int]] = {}
+
+    def get(self, key: str) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: int) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+        self._entries[key] = (now + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache(settings.COUNT_CACHE_TTL_SECONDS)
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed with its bound parameters."""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def query_signature(query: Select) -> str:
+    """Build a cache key from the SQL text and bound parameters of a query."""
+    compiled = query.compile()
+    params = sorted((k, repr(v)) for k, v in compiled.params.items())
+    return f"{compiled}|{params}"
+
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    """Count rows of a query, served from the TTL cache when possible."""
+    key = query_signature(query)
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    total = await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+    count_cache.set(key, total)
+    return total
+
+
+async def estimated_count(db: AsyncSession, query: Select, table_name: str) -> int:
+    """
+    Estimate the row count of a query from planner statistics.
+    Unfiltered queries read pg_class.reltuples; filtered queries read the
+    row estimate of EXPLAIN. Falls back to an exact count off Postgres.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return await exact_count(db, query)
+
+    try:
+        # A savepoint keeps a failed EXPLAIN from aborting the request transaction.
+        async with db.begin_nested():
+            if query.whereclause is None:
+                estimate = await db.scalar(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+                    {"name": table_name}
+                )
+            else:
+                plan = await db.scalar(Explain(query))
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]["Plan"]["Plan Rows"]
+    except Exception as e:
+        logger.warning(f"Count estimate failed, using exact count: {str(e)}")
+        return await exact_count(db, query)
+
+    # reltuples is -1 for tables that have never been analyzed.
+    if estimate is None or estimate < 0:
+        return await exact_count(db, query)
+    return int(estimate)
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    mode: CountMode,
+    table_name: str
+) -> Optional[int]:
+    """Count the rows of a list query according to the requested count mode."""
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.ESTIMATED:
+        return await estimated_count(db, query, table_name)
+    return await exact_count(db, query)
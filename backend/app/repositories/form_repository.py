@@ -1,9 +1,27 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
-from typing import Optional, List
+from sqlalchemy import select, update, insert, delete, func, or_
+from sqlalchemy.engine import Row
+from typing import Optional, List, Dict
 from uuid import UUID
-from app.models import Form
-from app.schemas import FormCreate, FormUpdate
+from app.models import Form, FormVersion
+from app.schemas import FormCreate, FormUpdate, CountMode
+from app.repositories.counting import count_rows
+
+# Advisory lock key serializing changes to which form is active.
+ACTIVE_FORM_LOCK_KEY = 0x666F726D
+
+# Columns of FormListItem; the question count is computed in SQL rather than loading questions.
+LIST_COLUMNS = (
+    Form.id,
+    Form.title,
+    Form.description,
+    func.coalesce(func.jsonb_array_length(Form.questions), 0).label('question_count'),
+    Form.is_active,
+    Form.created_at,
+)
+
+# Columns whose change creates a new form version.
+VERSIONED_FIELDS = ('title', 'description', 'questions')
 
 
 class FormRepository:
@@ -11,14 +29,24 @@ class FormRepository:
         self.db = db
 
     async def create(self, form_data: FormCreate) -> Form:
-        """Create a new form."""
+        """Create a new form. Creating an active form deactivates the current one."""
         form_dict = form_data.model_dump()
         form_dict['questions'] = [q.model_dump() for q in form_data.questions]
         
+        if form_dict.get('is_active'):
+            await self._lock_active_form()
+            await self.db.execute(
+                update(Form)
+                .where(Form.is_active == True)
+                .values(is_active=False)
+                .execution_options(synchronize_session=False)
+            )
+        
         form = Form(**form_dict)
         self.db.add(form)
         await self.db.flush()
         await self.db.refresh(form)
+        await self._snapshot(form)
         return form
 
     async def get_by_id(self, form_id: UUID) -> Optional[Form]:
@@ -28,6 +56,19 @@ class FormRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_current_versions(self, form_ids: List[UUID]) -> Dict[UUID, int]:
+        """Return the current version of each form in form_ids that exists."""
+        if not form_ids:
+            return {}
+        result = await self.db.execute(
+            select(Form.id, Form.version).where(Form.id.in_(form_ids))
+        )
+        return dict(result.all())
+
+    async def get_version(self, form_id: UUID, version: int) -> Optional[FormVersion]:
+        """Get an immutable form version snapshot."""
+        return await self.db.get(FormVersion, (form_id, version))
+
     async def get_active(self) -> Optional[Form]:
         """Get the active form."""
         result = await self.db.execute(
@@ -41,25 +82,33 @@ class FormRepository:
         self,
         skip: int = 0,
         limit: int = 100,
-        is_active: Optional[bool] = None
-    ) -> tuple[List[Form], int]:
-        """Get all forms with pagination."""
-        query = select(Form)
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[List[Row], Optional[int], bool]:
+        """
+        Get a page of form list rows (LIST_COLUMNS).
+        Returns the page, the total (None when count_mode is NONE) and whether more rows follow.
+        """
+        query = select(*LIST_COLUMNS)
         
         if is_active is not None:
             query = query.where(Form.is_active == is_active)
         
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
+        total = await count_rows(self.db, query, count_mode, Form.__tablename__)
         
-        query = query.order_by(Form.created_at.desc()).offset(skip).limit(limit)
+        query = query.order_by(Form.created_at.desc()).offset(skip).limit(limit + 1)
         result = await self.db.execute(query)
-        forms = result.scalars().all()
+        forms = list(result.all())
         
-        return list(forms), total or 0
+        has_next = len(forms) > limit
+        return forms[:limit], total, has_next
 
     async def update(self, form_id: UUID, form_data: FormUpdate) -> Optional[Form]:
-        """Update a form."""
+        """
+        Update a form. Returns None if the form does not exist.
+        Changing the title, description or questions bumps the version and
+        stores a snapshot of the new content.
+        """
         update_data = form_data.model_dump(exclude_unset=True)
         
         if 'questions' in update_data and update_data['questions']:
@@ -68,45 +117,84 @@ class FormRepository:
         if not update_data:
             return await self.get_by_id(form_id)
         
-        await self.db.execute(
+        if update_data.get('is_active'):
+            await self._lock_active_form()
+            await self.db.execute(
+                update(Form)
+                .where(Form.is_active == True, Form.id != form_id, self._exists(form_id))
+                .values(is_active=False)
+                .execution_options(synchronize_session=False)
+            )
+        
+        versioned = any(field in update_data for field in VERSIONED_FIELDS)
+        if versioned:
+            update_data['version'] = Form.version + 1
+        
+        result = await self.db.execute(
             update(Form)
             .where(Form.id == form_id)
             .values(**update_data)
+            .returning(Form)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
-        await self.db.flush()
-        
-        return await self.get_by_id(form_id)
+        form = result.scalar_one_or_none()
+        if form and versioned:
+            await self._snapshot(form)
+        return form
 
     async def delete(self, form_id: UUID) -> bool:
         """Delete a form."""
         result = await self.db.execute(
             delete(Form).where(Form.id == form_id)
         )
-        await self.db.flush()
         return result.rowcount > 0
 
     async def activate(self, form_id: UUID) -> Optional[Form]:
-        """Activate a form and deactivate others."""
-        await self.db.execute(
-            update(Form).values(is_active=False)
-        )
-        
-        await self.db.execute(
+        """
+        Activate a form and deactivate the previously active one.
+        The swap is a single UPDATE that touches only those two rows; concurrent
+        activations queue on an advisory lock so exactly one form ends up active.
+        Nothing changes, and None is returned, if the form does not exist.
+        """
+        await self._lock_active_form()
+        result = await self.db.execute(
             update(Form)
-            .where(Form.id == form_id)
-            .values(is_active=True)
+            .where(or_(Form.is_active == True, Form.id == form_id), self._exists(form_id))
+            .values(is_active=(Form.id == form_id))
+            .returning(Form)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
-        await self.db.flush()
-        
-        return await self.get_by_id(form_id)
+        return next((form for form in result.scalars() if form.id == form_id), None)
 
     async def deactivate(self, form_id: UUID) -> Optional[Form]:
-        """Deactivate a form."""
-        await self.db.execute(
+        """Deactivate a form. Returns None if the form does not exist."""
+        result = await self.db.execute(
             update(Form)
             .where(Form.id == form_id)
             .values(is_active=False)
+            .returning(Form)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
-        await self.db.flush()
-        
-        return await self.get_by_id(form_id)
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    async def _snapshot(self, form: Form) -> None:
+        """Store the form's current content as its version snapshot."""
+        await self.db.execute(
+            insert(FormVersion).values(
+                form_id=form.id,
+                version=form.version,
+                title=form.title,
+                description=form.description,
+                questions=form.questions
+            )
+        )
+
+    async def _lock_active_form(self) -> None:
+        """Hold the active-form advisory lock until the transaction ends."""
+        await self.db.execute(select(func.pg_advisory_xact_lock(ACTIVE_FORM_LOCK_KEY)))
+
+    @staticmethod
+    def _exists(form_id: UUID):
+        """EXISTS condition for form_id that does not correlate with an outer forms query."""
+        target = Form.__table__.alias("target")
+        return select(target.c.id).where(target.c.id == form_id).exists()
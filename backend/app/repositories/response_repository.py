@@ -1,32 +1,108 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, or_
-from typing import Optional, List
+from sqlalchemy import select, update, delete, func, or_, and_, cast, tuple_, text, literal_column, union_all, Date, Text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select, Subquery
+from typing import Optional, List, Dict, Tuple, AsyncIterator, Sequence
+from asyncpg.exceptions import UniqueViolationError
 from uuid import UUID
-from datetime import datetime
-from app.models import Response, ResponseStatus
-from app.schemas import ResponseCreate, ResponseUpdate, ResponseFilter
-from app.utils.reference_code import generate_reference_code
+from datetime import datetime, date, timedelta, timezone
+from app.models import Response, ResponseStatus, ResponsePriority, ResponseDailyStat
+from app.models.response import SEARCH_CONFIG
+from app.schemas import ResponseCreate, ResponseUpdate, ResponseFilter, CountMode, StatsInterval
+from app.repositories.counting import count_rows
+from app.utils.reference_code import generate_reference_code, generate_reference_codes, validate_reference_code
+from app.utils.helpers import serialize_json
+from app.config import settings
+import uuid
+
+REFERENCE_CODE_ATTEMPTS = 5
+
+# Columns of ResponseListItem; list pages select only these, as plain rows.
+LIST_COLUMNS = (
+    Response.id,
+    Response.form_id,
+    Response.form_version,
+    Response.reference_code,
+    Response.status,
+    Response.priority,
+    Response.submitted_at,
+    Response.created_at,
+)
 
 
 class ResponseRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create(self, response_data: ResponseCreate) -> Response:
-        """Create a new response."""
-        reference_code = await self._generate_unique_reference_code()
-        
+    async def create(self, response_data: ResponseCreate, form_version: int) -> Response:
+        """
+        Create a new response.
+        Inserts with ON CONFLICT (reference_code) DO NOTHING RETURNING, so the
+        unique index is the only collision guard and a clash costs one retry.
+        """
         response_dict = response_data.model_dump()
-        response_dict['reference_code'] = reference_code
+        response_dict['form_version'] = form_version
         
         if response_dict.get('status') == ResponseStatus.SUBMITTED:
             response_dict['submitted_at'] = datetime.utcnow()
         
-        response = Response(**response_dict)
-        self.db.add(response)
+        for _ in range(REFERENCE_CODE_ATTEMPTS):
+            response_dict['reference_code'] = generate_reference_code()
+            result = await self.db.execute(
+                pg_insert(Response)
+                .values(**response_dict)
+                .on_conflict_do_nothing(index_elements=['reference_code'])
+                .returning(Response)
+            )
+            response = result.scalar_one_or_none()
+            if response:
+                await self._adjust_stats(response.form_id, response.created_at, response.status, response.priority, 1)
+                return response
+        
+        raise ValueError("Failed to generate unique reference code")
+
+    async def create_many(
+        self,
+        items: List[ResponseCreate],
+        form_versions: Dict[UUID, int]
+    ) -> List[Tuple[UUID, str]]:
+        """
+        Create responses in bulk against the given current version of each form.
+        Uses one multi-row INSERT ... RETURNING, or COPY for batches of at least
+        BATCH_COPY_THRESHOLD items. Returns (id, reference_code) pairs in input order.
+        """
+        if not items:
+            return []
+        
+        reference_codes = generate_reference_codes(len(items))
+        submitted_at = datetime.now(timezone.utc)
+        
+        rows = []
+        for item, reference_code in zip(items, reference_codes):
+            row = item.model_dump()
+            row['id'] = uuid.uuid4()
+            row['form_version'] = form_versions[item.form_id]
+            row['reference_code'] = reference_code
+            row['status'] = ResponseStatus(row.get('status') or ResponseStatus.SUBMITTED)
+            row['priority'] = ResponsePriority.MEDIUM
+            row['submitted_at'] = submitted_at if row['status'] == ResponseStatus.SUBMITTED else None
+            rows.append(row)
+        
+        if len(rows) >= settings.BATCH_COPY_THRESHOLD and self.db.bind.dialect.driver == "asyncpg":
+            created_at = await self._copy_responses(rows)
+        else:
+            created_at = await self._insert_responses(rows)
+        
+        buckets = {}
+        for row in rows:
+            key = (row['form_id'], row['status'], row['priority'])
+            buckets[key] = buckets.get(key, 0) + 1
+        for (form_id, status, priority), delta in buckets.items():
+            await self._adjust_stats(form_id, created_at, status, priority, delta)
+        
         await self.db.flush()
-        await self.db.refresh(response)
-        return response
+        return [(row['id'], row['reference_code']) for row in rows]
 
     async def get_by_id(self, response_id: UUID) -> Optional[Response]:
         """Get response by ID."""
@@ -46,118 +122,519 @@ class ResponseRepository:
         self,
         skip: int = 0,
         limit: int = 100,
-        filters: Optional[ResponseFilter] = None
-    ) -> tuple[List[Response], int]:
-        """Get all responses with pagination and filters."""
-        query = select(Response)
-        
-        if filters:
-            if filters.status:
-                query = query.where(Response.status == filters.status)
-            if filters.priority:
-                query = query.where(Response.priority == filters.priority)
-            if filters.form_id:
-                query = query.where(Response.form_id == filters.form_id)
-            if filters.date_from:
-                query = query.where(Response.created_at >= filters.date_from)
-            if filters.date_to:
-                query = query.where(Response.created_at <= filters.date_to)
-            if filters.search:
-                search_term = f"%{filters.search}%"
-                query = query.where(
-                    or_(
-                        Response.reference_code.ilike(search_term),
-                        Response.notes.ilike(search_term)
-                    )
-                )
-        
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
-        
-        query = query.order_by(Response.created_at.desc()).offset(skip).limit(limit)
+        filters: Optional[ResponseFilter] = None,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[List[Row], Optional[int], bool]:
+        """
+        Get a page of list rows (LIST_COLUMNS) with pagination and filters.
+        Returns the page, the filtered total (None when count_mode is NONE) and whether more rows follow.
+        """
+        query = self._apply_filters(select(*LIST_COLUMNS), filters)
+        
+        total = await count_rows(self.db, query, count_mode, Response.__tablename__)
+        
+        tsquery = self._search_tsquery(filters)
+        if tsquery is not None:
+            query = query.order_by(func.ts_rank_cd(Response.search_vector, tsquery).desc())
+        
+        query = query.order_by(Response.created_at.desc(), Response.id.desc()).offset(skip).limit(limit + 1)
+        result = await self.db.execute(query)
+        responses = list(result.all())
+        
+        has_next = len(responses) > limit
+        return responses[:limit], total, has_next
+
+    async def get_all_after(
+        self,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        filters: Optional[ResponseFilter] = None,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[List[Row], Optional[int], bool]:
+        """
+        Get list rows (LIST_COLUMNS) with keyset pagination on (created_at, id).
+        Returns the page, the filtered total (None when count_mode is NONE) and whether more rows follow.
+        """
+        query = self._apply_filters(select(*LIST_COLUMNS), filters)
+        
+        total = await count_rows(self.db, query, count_mode, Response.__tablename__)
+        
+        if after:
+            query = query.where(tuple_(Response.created_at, Response.id) < tuple_(*after))
+        
+        query = query.order_by(Response.created_at.desc(), Response.id.desc()).limit(limit + 1)
         result = await self.db.execute(query)
-        responses = result.scalars().all()
+        responses = list(result.all())
         
-        return list(responses), total or 0
+        has_more = len(responses) > limit
+        return responses[:limit], total, has_more
 
-    async def update(self, response_id: UUID, response_data: ResponseUpdate) -> Optional[Response]:
-        """Update a response."""
+    async def stream_for_export(
+        self,
+        filters: Optional[ResponseFilter] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream responses oldest first through a server-side cursor.
+        Yields partitions of at most batch_size rows so memory stays flat.
+        """
+        query = self._apply_filters(
+            select(
+                Response.id,
+                Response.form_id,
+                Response.form_version,
+                Response.reference_code,
+                Response.status,
+                Response.priority,
+                Response.tags,
+                Response.notes,
+                Response.submitted_at,
+                Response.created_at,
+                Response.data
+            ),
+            filters
+        ).order_by(Response.created_at, Response.id)
+        
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def update(self, response_id: UUID, response_data: ResponseUpdate) -> Optional[Tuple[Response, ResponseStatus]]:
+        """
+        Update a response with a single UPDATE ... RETURNING.
+        Returns the updated response and its status before the update,
+        or None if the response does not exist.
+        """
         update_data = response_data.model_dump(exclude_unset=True)
         
         if not update_data:
-            return await self.get_by_id(response_id)
+            response = await self.get_by_id(response_id)
+            return (response, response.status) if response else None
         
-        if 'status' in update_data and update_data['status'] == ResponseStatus.SUBMITTED:
-            existing = await self.get_by_id(response_id)
-            if existing and not existing.submitted_at:
-                update_data['submitted_at'] = datetime.utcnow()
+        if update_data.get('status') == ResponseStatus.SUBMITTED:
+            update_data['submitted_at'] = func.coalesce(Response.submitted_at, func.now())
         
-        if 'status' in update_data and update_data['status'] == ResponseStatus.REVIEWED:
-            update_data['reviewed_at'] = datetime.utcnow()
+        if update_data.get('status') == ResponseStatus.REVIEWED:
+            update_data['reviewed_at'] = func.now()
         
-        await self.db.execute(
-            update(Response)
-            .where(Response.id == response_id)
-            .values(**update_data)
-        )
-        await self.db.flush()
-        
-        return await self.get_by_id(response_id)
+        return await self._update_returning(response_id, update_data)
 
     async def delete(self, response_id: UUID) -> bool:
         """Delete a response."""
         result = await self.db.execute(
-            delete(Response).where(Response.id == response_id)
-        )
-        await self.db.flush()
-        return result.rowcount > 0
-
-    async def submit(self, response_id: UUID) -> Optional[Response]:
-        """Submit a response."""
-        await self.db.execute(
-            update(Response)
+            delete(Response)
             .where(Response.id == response_id)
-            .values(
-                status=ResponseStatus.SUBMITTED,
-                submitted_at=datetime.utcnow()
-            )
+            .returning(Response.form_id, Response.created_at, Response.status, Response.priority)
         )
-        await self.db.flush()
+        deleted = result.one_or_none()
         
-        return await self.get_by_id(response_id)
+        if not deleted:
+            return False
+        
+        await self._adjust_stats(deleted.form_id, deleted.created_at, deleted.status, deleted.priority, -1)
+        return True
+
+    async def submit(self, response_id: UUID) -> Optional[Tuple[Response, ResponseStatus]]:
+        """
+        Submit a response. Returns the updated response and its status before
+        the update, or None if the response does not exist.
+        """
+        return await self._update_returning(
+            response_id,
+            {'status': ResponseStatus.SUBMITTED, 'submitted_at': func.now()}
+        )
 
-    async def get_stats(self, form_id: Optional[UUID] = None) -> dict:
-        """Get response statistics."""
-        query = select(Response)
-        if form_id:
-            query = query.where(Response.form_id == form_id)
+    async def get_stats(
+        self,
+        form_id: Optional[UUID] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        interval: Optional[StatsInterval] = None
+    ) -> dict:
+        """
+        Get response statistics from the daily counters table.
+        Date filters are exact: partial days at the edges of the range are
+        aggregated from the responses table. When interval is set, also
+        returns per-day or per-week counts of created_at (UTC days).
+        """
+        counts = self._stats_counts(form_id, date_from, date_to)
         
-        result = await self.db.execute(query)
-        responses = result.scalars().all()
+        count = func.sum(counts.c.responses)
+        result = await self.db.execute(
+            select(counts.c.status, counts.c.priority, count)
+            .group_by(counts.c.status, counts.c.priority)
+            .having(count > 0)
+        )
         
         stats = {
-            'total': len(responses),
+            'total': 0,
             'by_status': {},
             'by_priority': {},
         }
         
-        for response in responses:
-            status = response.status.value if hasattr(response.status, 'value') else response.status
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
+        for status, priority, count in result.all():
+            count = int(count)
+            stats['total'] += count
             
-            if response.priority:
-                priority = response.priority.value if hasattr(response.priority, 'value') else response.priority
-                stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
+            status = status.value if hasattr(status, 'value') else status
+            stats['by_status'][status] = stats['by_status'].get(status, 0) + count
+            
+            if priority:
+                priority = priority.value if hasattr(priority, 'value') else priority
+                stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + count
+        
+        if interval:
+            stats['interval'] = interval.value
+            stats['timeline'] = await self._get_timeline(counts, interval)
         
         return stats
 
-    async def _generate_unique_reference_code(self) -> str:
-        """Generate a unique reference code."""
-        max_attempts = 10
-        for _ in range(max_attempts):
-            code = generate_reference_code()
-            existing = await self.get_by_reference(code)
-            if not existing:
-                return code
+    async def rebuild_stats(self) -> int:
+        """
+        Rebuild the daily counters table from the responses table.
+        Used for backfill and drift repair; returns the number of buckets written.
+        """
+        # Block concurrent counter writes so in-flight mutations land after the rebuild.
+        await self.db.execute(text(f"LOCK TABLE {ResponseDailyStat.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+        await self.db.execute(delete(ResponseDailyStat))
         
-        raise ValueError("Failed to generate unique reference code")
\ No newline at end of file
+        day = func.timezone('UTC', Response.created_at).cast(Date)
+        result = await self.db.execute(
+            pg_insert(ResponseDailyStat).from_select(
+                ['form_id', 'day', 'status', 'priority', 'count'],
+                select(Response.form_id, day, Response.status, Response.priority, func.count())
+                .group_by(Response.form_id, day, Response.status, Response.priority)
+            )
+        )
+        await self.db.flush()
+        return result.rowcount
+
+    async def _get_timeline(self, counts: Subquery, interval: StatsInterval) -> List[dict]:
+        """Sum daily counts per day or week bucket and status."""
+        # date_trunc on a date yields a timestamptz in the session time zone; cast back in SQL.
+        bucket = cast(func.date_trunc(interval.value, counts.c.day), Date).label('bucket')
+        count = func.sum(counts.c.responses)
+        result = await self.db.execute(
+            select(bucket, counts.c.status, count)
+            .group_by(bucket, counts.c.status)
+            .having(count > 0)
+            .order_by(bucket)
+        )
+        
+        timeline = {}
+        for bucket_start, status, count in result.all():
+            key = bucket_start.isoformat()
+            entry = timeline.setdefault(key, {'bucket': key, 'total': 0, 'by_status': {}})
+            status = status.value if hasattr(status, 'value') else status
+            entry['total'] += int(count)
+            entry['by_status'][status] = int(count)
+        
+        return list(timeline.values())
+
+    def _stats_counts(
+        self,
+        form_id: Optional[UUID],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime]
+    ) -> Subquery:
+        """
+        Build (day, status, priority, responses) rows covering exactly date_from <= created_at <= date_to.
+        Whole UTC days come from the counters table; partial days at either end are
+        counted from the responses table, so only those rows are scanned.
+        """
+        date_from = self._as_utc(date_from) if date_from else None
+        date_to = self._as_utc(date_to) if date_to else None
+        
+        # (start, end, end inclusive) ranges of created_at counted from responses.
+        raw_ranges = []
+        first_day = last_day = None
+        if date_from:
+            first_day = self._stats_day(date_from)
+            if date_from != self._day_start(first_day):
+                first_day += timedelta(days=1)
+                raw_ranges.append((date_from, self._day_start(first_day), False))
+        if date_to:
+            last_day = self._stats_day(date_to)
+            if date_to + timedelta(microseconds=1) != self._day_start(last_day + timedelta(days=1)):
+                raw_ranges.append((self._day_start(last_day), date_to, True))
+                last_day -= timedelta(days=1)
+        
+        sources = []
+        if first_day is not None and last_day is not None and first_day > last_day:
+            # No whole day in range: count it all from the responses table.
+            raw_ranges = [(date_from, date_to, True)]
+        else:
+            conditions = []
+            if form_id:
+                conditions.append(ResponseDailyStat.form_id == form_id)
+            if first_day is not None:
+                conditions.append(ResponseDailyStat.day >= first_day)
+            if last_day is not None:
+                conditions.append(ResponseDailyStat.day <= last_day)
+            sources.append(
+                select(ResponseDailyStat.day, ResponseDailyStat.status, ResponseDailyStat.priority, ResponseDailyStat.count.label('responses'))
+                .where(*conditions)
+            )
+        
+        day = func.timezone('UTC', Response.created_at).cast(Date)
+        for range_start, range_end, end_inclusive in raw_ranges:
+            conditions = [
+                Response.created_at >= range_start,
+                Response.created_at <= range_end if end_inclusive else Response.created_at < range_end,
+            ]
+            if form_id:
+                conditions.append(Response.form_id == form_id)
+            sources.append(
+                select(day.label('day'), Response.status, Response.priority, func.count().label('responses'))
+                .where(*conditions)
+                .group_by(day, Response.status, Response.priority)
+            )
+        
+        query = sources[0] if len(sources) == 1 else union_all(*sources)
+        return query.subquery('counts')
+
+    async def _update_returning(self, response_id: UUID, values: dict) -> Optional[Tuple[Response, ResponseStatus]]:
+        """
+        Apply values to one response and return the updated row in the same round trip.
+        The previous status and priority are read under a row lock by a CTE of the
+        same statement, so the stats buckets can be moved and callers can check the
+        new row before the transaction commits.
+        """
+        previous = (
+            select(Response.id, Response.status, Response.priority)
+            .where(Response.id == response_id)
+            .with_for_update()
+            .cte("previous")
+        )
+        stmt = (
+            update(Response)
+            .values(**values)
+            .where(Response.id == previous.c.id)
+            .returning(Response, previous.c.status, previous.c.priority)
+        )
+        
+        result = await self.db.execute(
+            stmt.execution_options(synchronize_session=False, populate_existing=True)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        
+        response = row[0]
+        await self._move_stats(response, row[1], row[2])
+        return response, ResponseStatus(row[1])
+
+    async def _move_stats(
+        self,
+        response: Response,
+        old_status: ResponseStatus,
+        old_priority: Optional[ResponsePriority]
+    ) -> None:
+        """Move an updated response from its previous stats bucket to its current one."""
+        if ResponseStatus(response.status) == ResponseStatus(old_status) and response.priority == old_priority:
+            return
+        
+        await self._upsert_stats([
+            self._stats_bucket(response.form_id, response.created_at, old_status, old_priority, -1),
+            self._stats_bucket(response.form_id, response.created_at, response.status, response.priority, 1),
+        ])
+
+    async def _adjust_stats(
+        self,
+        form_id: UUID,
+        created_at: datetime,
+        status: ResponseStatus,
+        priority: Optional[ResponsePriority],
+        delta: int
+    ) -> None:
+        """Add delta to the counter for a (form, day, status, priority) bucket."""
+        await self._upsert_stats([self._stats_bucket(form_id, created_at, status, priority, delta)])
+
+    async def _upsert_stats(self, buckets: List[dict]) -> None:
+        """Add each bucket's count to its counter row in one INSERT ... ON CONFLICT."""
+        stmt = pg_insert(ResponseDailyStat).values(buckets)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=['form_id', 'day', 'status', 'priority'],
+                set_={'count': ResponseDailyStat.count + stmt.excluded.count}
+            )
+        )
+
+    def _stats_bucket(
+        self,
+        form_id: UUID,
+        created_at: datetime,
+        status: ResponseStatus,
+        priority: Optional[ResponsePriority],
+        delta: int
+    ) -> dict:
+        """Build the counter row values for one stats bucket."""
+        return {
+            'form_id': form_id,
+            'day': self._stats_day(created_at),
+            'status': ResponseStatus(status),
+            'priority': ResponsePriority(priority) if priority else None,
+            'count': delta,
+        }
+
+    @staticmethod
+    def _stats_day(value: datetime) -> date:
+        """Return the UTC calendar day used to bucket a timestamp."""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.date()
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Return an aware UTC timestamp; naive values are taken as UTC."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def _day_start(day: date) -> datetime:
+        return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+    def _apply_filters(self, query: Select, filters: Optional[ResponseFilter]) -> Select:
+        """Apply list filters to a response query."""
+        if not filters:
+            return query
+        
+        if filters.status:
+            query = query.where(Response.status == filters.status)
+        if filters.priority:
+            query = query.where(Response.priority == filters.priority)
+        if filters.form_id:
+            query = query.where(Response.form_id == filters.form_id)
+        if filters.date_from:
+            query = query.where(Response.created_at >= filters.date_from)
+        if filters.date_to:
+            query = query.where(Response.created_at <= filters.date_to)
+        if filters.search:
+            reference_code = filters.search.strip().upper()
+            if validate_reference_code(reference_code):
+                query = query.where(Response.reference_code == reference_code)
+            else:
+                query = query.where(Response.search_vector.bool_op('@@')(self._search_tsquery(filters)))
+        if filters.answers:
+            query = query.where(self._answers_condition(filters.answers))
+        if filters.tags:
+            query = query.where(self._tags_condition(filters.tags))
+        
+        return query
+
+    def _answers_condition(self, answers: dict):
+        """
+        Match responses whose answers include every question_id -> value pair.
+        On Postgres each pair is a GIN-indexed @> containment; a value matches
+        both a single answer and an element of a multi-select answer.
+        """
+        if self.db.bind.dialect.name != "postgresql":
+            return and_(*(
+                func.json_extract(Response.data, f'$."{question_id}"') == value
+                for question_id, value in answers.items()
+            ))
+        
+        return and_(*(
+            or_(
+                Response.data.contains({question_id: value}),
+                Response.data.contains({question_id: [value]})
+            )
+            for question_id, value in answers.items()
+        ))
+
+    def _tags_condition(self, tags: List[str]):
+        """Match responses carrying all of the given tags (GIN-indexed @> on Postgres)."""
+        if self.db.bind.dialect.name != "postgresql":
+            return and_(*(
+                cast(Response.tags, Text).like(f'%"{tag}"%')
+                for tag in tags
+            ))
+        
+        return Response.tags.contains(tags)
+
+    def _search_tsquery(self, filters: Optional[ResponseFilter]):
+        """
+        Build the full-text query for a free-text search, or None when the
+        filters have no search term or the term is a reference code.
+        """
+        if not filters or not filters.search:
+            return None
+        if validate_reference_code(filters.search.strip().upper()):
+            return None
+        return func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), filters.search)
+
+    async def _insert_responses(self, rows: List[dict]) -> datetime:
+        """
+        Insert rows with multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING.
+        Rows whose reference code collided get a new code and are re-inserted.
+        Returns the transaction timestamp used for created_at.
+        """
+        pending = rows
+        created_at = None
+        for _ in range(REFERENCE_CODE_ATTEMPTS):
+            result = await self.db.execute(
+                pg_insert(Response)
+                .on_conflict_do_nothing(index_elements=['reference_code'])
+                .returning(Response.id, Response.created_at),
+                pending
+            )
+            inserted = result.all()
+            if inserted:
+                # created_at defaults to now(), which is fixed for the whole transaction.
+                created_at = inserted[0].created_at
+            
+            inserted_ids = {row.id for row in inserted}
+            pending = [row for row in pending if row['id'] not in inserted_ids]
+            if not pending:
+                return created_at
+            
+            for row, reference_code in zip(pending, generate_reference_codes(len(pending))):
+                row['reference_code'] = reference_code
+        
+        raise ValueError("Failed to generate unique reference codes")
+
+    async def _copy_responses(self, rows: List[dict]) -> datetime:
+        """
+        Load rows with asyncpg COPY and return the transaction timestamp used for created_at.
+        COPY cannot skip conflicts, so a reference code collision rolls back to a
+        savepoint and the whole load is retried with fresh codes. COPY runs on the
+        driver connection, so the collision surfaces as asyncpg's UniqueViolationError.
+        """
+        for _ in range(REFERENCE_CODE_ATTEMPTS):
+            try:
+                async with self.db.begin_nested():
+                    await self._copy_records(rows)
+                return await self.db.scalar(select(func.now()))
+            except UniqueViolationError:
+                for row, reference_code in zip(rows, generate_reference_codes(len(rows))):
+                    row['reference_code'] = reference_code
+        
+        raise ValueError("Failed to generate unique reference codes")
+
+    async def _copy_records(self, rows: List[dict]) -> None:
+        """Write rows to the responses table with asyncpg copy_records_to_table."""
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        
+        # COPY bypasses SQLAlchemy types: JSON goes as text and enums as their stored names.
+        records = [
+            (
+                row['id'],
+                row['form_id'],
+                row['form_version'],
+                serialize_json(row['data']),
+                row['reference_code'],
+                row['status'].name,
+                row['priority'].name,
+                '[]',
+                '{}',
+                row['submitted_at'],
+            )
+            for row in rows
+        ]
+        await raw_connection.driver_connection.copy_records_to_table(
+            Response.__tablename__,
+            records=records,
+            columns=['id', 'form_id', 'form_version', 'data', 'reference_code', 'status', 'priority', 'tags', 'metadata', 'submitted_at']
+        )
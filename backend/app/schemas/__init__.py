@@ -3,6 +3,8 @@ from app.schemas.common import (
     TimestampSchema,
     IDSchema,
     PaginatedResponse,
+    PaginationMode,
+    CountMode,
     SuccessResponse,
     ErrorResponse
 )
@@ -12,22 +14,31 @@ from app.schemas.form import (
     FormCreate,
     FormUpdate,
     FormResponse,
+    FormVersionResponse,
     FormListItem
 )
 from app.schemas.response import (
     ResponseBase,
     ResponseCreate,
+    ResponseBatchCreate,
+    ResponseBatchItemResult,
+    ResponseBatchResult,
     ResponseUpdate,
     ResponseResponse,
     ResponseListItem,
-    ResponseFilter
+    ResponseFilter,
+    ExportFormat,
+    StatsInterval
 )
+from app.schemas.job import JobState, JobResponse
 
 __all__ = [
     "BaseSchema",
     "TimestampSchema",
     "IDSchema",
     "PaginatedResponse",
+    "PaginationMode",
+    "CountMode",
     "SuccessResponse",
     "ErrorResponse",
     "FormQuestionSchema",
@@ -35,11 +46,19 @@ __all__ = [
     "FormCreate",
     "FormUpdate",
     "FormResponse",
+    "FormVersionResponse",
     "FormListItem",
     "ResponseBase",
     "ResponseCreate",
+    "ResponseBatchCreate",
+    "ResponseBatchItemResult",
+    "ResponseBatchResult",
     "ResponseUpdate",
     "ResponseResponse",
     "ResponseListItem",
     "ResponseFilter",
+    "ExportFormat",
+    "StatsInterval",
+    "JobState",
+    "JobResponse",
 ]
\ No newline at end of file
@@ -2,6 +2,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import TypeVar, Generic, List, Optional
 from datetime import datetime
 from uuid import UUID
+import enum
 
 
 class BaseSchema(BaseModel):
@@ -20,12 +21,26 @@ class IDSchema(BaseSchema):
 T = TypeVar('T')
 
 
+class PaginationMode(str, enum.Enum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CountMode(str, enum.Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_next: bool = False
+    has_prev: bool = False
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
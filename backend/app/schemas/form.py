@@ -1,5 +1,6 @@
 from pydantic import Field, field_validator
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 from uuid import UUID
 from app.schemas.common import BaseSchema, TimestampSchema, IDSchema
 
@@ -41,6 +42,15 @@ class FormResponse(FormBase, IDSchema, TimestampSchema):
     version: int
 
 
+class FormVersionResponse(BaseSchema):
+    form_id: UUID
+    version: int
+    title: str
+    description: Optional[str] = None
+    questions: List[FormQuestionSchema] = Field(default_factory=list)
+    created_at: datetime
+
+
 class FormListItem(BaseSchema):
     id: UUID
     title: str
@@ -0,0 +1,21 @@
+from typing import Optional, Dict, Any
+from datetime import datetime
+import enum
+from app.schemas.common import BaseSchema
+
+
+class JobState(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobResponse(BaseSchema):
+    id: str
+    name: Optional[str] = None
+    state: JobState = JobState.PENDING
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    submitted_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
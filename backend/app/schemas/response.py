@@ -1,9 +1,11 @@
-from pydantic import Field
+from pydantic import Field, AliasChoices
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
+import enum
 from app.schemas.common import BaseSchema, TimestampSchema, IDSchema
 from app.models.response import ResponseStatus, ResponsePriority
+from app.config import settings
 
 
 class ResponseBase(BaseSchema):
@@ -15,6 +17,24 @@ class ResponseCreate(ResponseBase):
     status: Optional[ResponseStatus] = ResponseStatus.SUBMITTED
 
 
+class ResponseBatchCreate(BaseSchema):
+    items: List[ResponseCreate] = Field(..., min_length=1, max_length=settings.BATCH_MAX_ITEMS)
+
+
+class ResponseBatchItemResult(BaseSchema):
+    index: int
+    success: bool
+    id: Optional[UUID] = None
+    reference_code: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ResponseBatchResult(BaseSchema):
+    created: int
+    failed: int
+    results: List[ResponseBatchItemResult]
+
+
 class ResponseUpdate(BaseSchema):
     data: Optional[Dict[str, Any]] = None
     status: Optional[ResponseStatus] = None
@@ -24,6 +44,7 @@ class ResponseUpdate(BaseSchema):
 
 
 class ResponseResponse(ResponseBase, IDSchema, TimestampSchema):
+    form_version: int
     reference_code: str
     status: ResponseStatus
     priority: Optional[ResponsePriority] = None
@@ -32,12 +53,13 @@ class ResponseResponse(ResponseBase, IDSchema, TimestampSchema):
     submitted_at: Optional[datetime] = None
     reviewed_at: Optional[datetime] = None
     reviewed_by: Optional[UUID] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = Field(None, validation_alias=AliasChoices('metadata_', 'metadata'))
 
 
 class ResponseListItem(BaseSchema):
     id: UUID
     form_id: UUID
+    form_version: int
     reference_code: str
     status: ResponseStatus
     priority: Optional[ResponsePriority] = None
@@ -45,10 +67,22 @@ class ResponseListItem(BaseSchema):
     created_at: datetime
 
 
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class StatsInterval(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
 class ResponseFilter(BaseSchema):
     status: Optional[ResponseStatus] = None
     priority: Optional[ResponsePriority] = None
     form_id: Optional[UUID] = None
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
-    search: Optional[str] = None
\ No newline at end of file
+    search: Optional[str] = None
+    answers: Optional[Dict[str, str]] = None
+    tags: Optional[List[str]] = None
\ No newline at end of file
@@ -1,102 +1,158 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from app.repositories import FormRepository
-from app.schemas import FormCreate, FormUpdate, FormResponse, FormListItem, PaginatedResponse
+from app.schemas import FormCreate, FormUpdate, FormResponse, FormVersionResponse, FormListItem, PaginatedResponse, CountMode
+from app.utils.helpers import calculate_pagination
+from app.utils.answers import AnswerValidator
+from app.cache import CachedForm, active_form_cache, answer_validator_cache, form_cache, form_version_cache
 from app.models import Form
 from fastapi import HTTPException, status
 
 
 class FormService:
     def __init__(self, db: AsyncSession):
+        self.db = db
         self.repository = FormRepository(db)
 
     async def create_form(self, form_data: FormCreate) -> FormResponse:
         """Create a new form."""
         form = await self.repository.create(form_data)
+        await form_cache.invalidate_on_commit(self.db)
         return FormResponse.model_validate(form)
 
     async def get_form(self, form_id: UUID) -> FormResponse:
         """Get form by ID."""
+        cache_key = form_cache.key("form", form_id)
+        cached = await form_cache.get(cache_key)
+        if cached:
+            return FormResponse.model_validate_json(cached)
+        
         form = await self.repository.get_by_id(form_id)
         if not form:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Form not found"
             )
-        return FormResponse.model_validate(form)
+        
+        result = FormResponse.model_validate(form)
+        await form_cache.set(cache_key, result.model_dump_json().encode("utf-8"))
+        return result
 
     async def get_active_form(self) -> FormResponse:
         """Get the active form."""
+        cache_key = form_cache.key("active")
+        cached = await form_cache.get(cache_key)
+        if cached:
+            return FormResponse.model_validate_json(cached)
+        
         form = await self.repository.get_active()
         if not form:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No active form found"
             )
-        return FormResponse.model_validate(form)
+        
+        result = FormResponse.model_validate(form)
+        await form_cache.set(cache_key, result.model_dump_json().encode("utf-8"))
+        return result
+
+    async def get_active_form_cached(self) -> CachedForm:
+        """Get the serialized active form, served from the process-local cache when possible."""
+        cached = active_form_cache.get()
+        if cached:
+            return cached
+        
+        version = active_form_cache.version
+        form = await self.get_active_form()
+        return active_form_cache.set(version, form)
+
+    async def get_form_version(self, form_id: UUID, version: int) -> CachedForm:
+        """Get a serialized form version snapshot. Snapshots never change, so they are cached indefinitely."""
+        cached = form_version_cache.get(form_id, version)
+        if cached:
+            return cached
+        
+        snapshot = await self.repository.get_version(form_id, version)
+        if not snapshot:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Form version not found"
+            )
+        
+        return form_version_cache.set(FormVersionResponse.model_validate(snapshot))
+
+    async def get_current_answer_validator(self, form_id: UUID) -> Tuple[int, AnswerValidator]:
+        """Get the current version of a form and the compiled validator for its questions."""
+        form = await self.get_form(form_id)
+        validator = answer_validator_cache.get(form_id, form.version)
+        if validator is None:
+            validator = answer_validator_cache.compile(form_id, form.version, form.questions)
+        return form.version, validator
+
+    async def get_answer_validator(self, form_id: UUID, version: int) -> Optional[AnswerValidator]:
+        """Get the compiled validator for a form version, or None if the version does not exist."""
+        validator = answer_validator_cache.get(form_id, version)
+        if validator is not None:
+            return validator
+        
+        snapshot = await self.repository.get_version(form_id, version)
+        if not snapshot:
+            return None
+        return answer_validator_cache.compile(
+            form_id,
+            version,
+            FormVersionResponse.model_validate(snapshot).questions
+        )
 
     async def get_all_forms(
         self,
         page: int = 1,
         page_size: int = 20,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        count_mode: CountMode = CountMode.EXACT
     ) -> PaginatedResponse[FormListItem]:
         """Get all forms with pagination."""
+        cache_key = form_cache.key("list", page, page_size, is_active, count_mode.value)
+        cached = await form_cache.get(cache_key)
+        if cached:
+            return PaginatedResponse[FormListItem].model_validate_json(cached)
+        
         skip = (page - 1) * page_size
-        forms, total = await self.repository.get_all(skip, page_size, is_active)
-        
-        form_items = []
-        for form in forms:
-            item_data = {
-                'id': form.id,
-                'title': form.title,
-                'description': form.description,
-                'question_count': len(form.questions) if form.questions else 0,
-                'response_count': 0,
-                'is_active': form.is_active,
-                'created_at': form.created_at,
-            }
-            form_items.append(FormListItem.model_validate(item_data))
-        
-        total_pages = (total + page_size - 1) // page_size
-        
-        return PaginatedResponse(
+        forms, total, has_next = await self.repository.get_all(skip, page_size, is_active, count_mode)
+        
+        form_items = [FormListItem.model_validate(form) for form in forms]
+        
+        result = PaginatedResponse[FormListItem](
             data=form_items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            **calculate_pagination(total, page, page_size, has_next)
         )
+        await form_cache.set(cache_key, result.model_dump_json().encode("utf-8"))
+        return result
 
     async def update_form(self, form_id: UUID, form_data: FormUpdate) -> FormResponse:
         """Update a form."""
-        existing_form = await self.repository.get_by_id(form_id)
-        if not existing_form:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Form not found"
-            )
-        
         form = await self.repository.update(form_id, form_data)
         if not form:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update form"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Form not found"
             )
         
+        await form_cache.invalidate_on_commit(self.db)
         return FormResponse.model_validate(form)
 
     async def delete_form(self, form_id: UUID) -> bool:
         """Delete a form."""
-        existing_form = await self.repository.get_by_id(form_id)
-        if not existing_form:
+        deleted = await self.repository.delete(form_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Form not found"
             )
         
-        return await self.repository.delete(form_id)
+        await form_cache.invalidate_on_commit(self.db)
+        return deleted
 
     async def duplicate_form(self, form_id: UUID) -> FormResponse:
         """Duplicate a form."""
@@ -118,36 +174,24 @@ class FormService:
 
     async def activate_form(self, form_id: UUID) -> FormResponse:
         """Activate a form."""
-        existing_form = await self.repository.get_by_id(form_id)
-        if not existing_form:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Form not found"
-            )
-        
         form = await self.repository.activate(form_id)
         if not form:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to activate form"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Form not found"
             )
         
+        await form_cache.invalidate_on_commit(self.db)
         return FormResponse.model_validate(form)
 
     async def deactivate_form(self, form_id: UUID) -> FormResponse:
         """Deactivate a form."""
-        existing_form = await self.repository.get_by_id(form_id)
-        if not existing_form:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Form not found"
-            )
-        
         form = await self.repository.deactivate(form_id)
         if not form:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to deactivate form"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Form not found"
             )
         
+        await form_cache.invalidate_on_commit(self.db)
         return FormResponse.model_validate(form)
\ No newline at end of file
@@ -1,27 +1,96 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, List, AsyncIterator
 from uuid import UUID
-from app.repositories import ResponseRepository
+from datetime import datetime
+from app.repositories import ResponseRepository, FormRepository
+from app.services.form_service import FormService
+from app.models import ResponseStatus
 from app.schemas import (
     ResponseCreate,
+    ResponseBatchCreate,
+    ResponseBatchItemResult,
+    ResponseBatchResult,
     ResponseUpdate,
     ResponseResponse,
     ResponseListItem,
     ResponseFilter,
-    PaginatedResponse
+    PaginatedResponse,
+    CountMode,
+    ExportFormat,
+    StatsInterval
 )
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.helpers import calculate_pagination
+from app.utils.reference_code import validate_reference_code
+from app.utils.export import csv_header, csv_chunk, ndjson_chunk
+from app.utils.answers import AnswerValidator
 from fastapi import HTTPException, status
 
 
 class ResponseService:
     def __init__(self, db: AsyncSession):
         self.repository = ResponseRepository(db)
+        self.form_repository = FormRepository(db)
+        self.form_service = FormService(db)
 
     async def create_response(self, response_data: ResponseCreate) -> ResponseResponse:
-        """Create a new response."""
-        response = await self.repository.create(response_data)
+        """Create a new response against the current version of its form."""
+        version, validator = await self.form_service.get_current_answer_validator(response_data.form_id)
+        errors = self._validate_answers(validator, response_data)
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=errors
+            )
+        
+        response = await self.repository.create(response_data, version)
         return ResponseResponse.model_validate(response)
 
+    async def create_responses_batch(self, batch: ResponseBatchCreate) -> ResponseBatchResult:
+        """
+        Create many responses in one bulk insert.
+        Items that fail validation are reported per index and skipped; the rest are stored.
+        """
+        form_versions = await self.form_repository.get_current_versions(
+            list({item.form_id for item in batch.items})
+        )
+        
+        validators = {}
+        for form_id, version in form_versions.items():
+            validators[form_id] = await self.form_service.get_answer_validator(form_id, version)
+        
+        results = [None] * len(batch.items)
+        accepted = []
+        for index, item in enumerate(batch.items):
+            if item.form_id not in form_versions:
+                results[index] = ResponseBatchItemResult(index=index, success=False, error="Form not found")
+                continue
+            
+            errors = self._validate_answers(validators[item.form_id], item)
+            if errors:
+                results[index] = ResponseBatchItemResult(
+                    index=index,
+                    success=False,
+                    error="; ".join(f"{error['field']}: {error['message']}" for error in errors)
+                )
+            else:
+                accepted.append(index)
+        
+        created = await self.repository.create_many([batch.items[index] for index in accepted], form_versions)
+        for index, (response_id, reference_code) in zip(accepted, created):
+            results[index] = ResponseBatchItemResult(
+                index=index,
+                success=True,
+                id=response_id,
+                reference_code=reference_code
+            )
+        
+        return ResponseBatchResult(
+            created=len(created),
+            failed=len(batch.items) - len(created),
+            results=results
+        )
+
     async def get_response(self, response_id: UUID) -> ResponseResponse:
         """Get response by ID."""
         response = await self.repository.get_by_id(response_id)
@@ -34,7 +103,10 @@ class ResponseService:
 
     async def get_response_by_reference(self, reference_code: str) -> ResponseResponse:
         """Get response by reference code."""
-        response = await self.repository.get_by_reference(reference_code)
+        # Malformed codes and typos fail the check character, so skip the lookup.
+        response = None
+        if validate_reference_code(reference_code):
+            response = await self.repository.get_by_reference(reference_code)
         if not response:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,25 +118,60 @@ class ResponseService:
         self,
         page: int = 1,
         page_size: int = 20,
-        filters: Optional[ResponseFilter] = None
+        filters: Optional[ResponseFilter] = None,
+        count_mode: CountMode = CountMode.EXACT
     ) -> PaginatedResponse[ResponseListItem]:
         """Get all responses with pagination and filters."""
         skip = (page - 1) * page_size
-        responses, total = await self.repository.get_all(skip, page_size, filters)
+        responses, total, has_next = await self.repository.get_all(skip, page_size, filters, count_mode)
+        
+        response_items = [
+            ResponseListItem.model_validate(response) 
+            for response in responses
+        ]
+        
+        return PaginatedResponse(
+            data=response_items,
+            **calculate_pagination(total, page, page_size, has_next)
+        )
+
+    async def get_responses_after(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        filters: Optional[ResponseFilter] = None,
+        count_mode: CountMode = CountMode.EXACT
+    ) -> PaginatedResponse[ResponseListItem]:
+        """Get responses with cursor (keyset) pagination and filters."""
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+        
+        responses, total, has_more = await self.repository.get_all_after(after, page_size, filters, count_mode)
         
         response_items = [
             ResponseListItem.model_validate(response) 
             for response in responses
         ]
         
-        total_pages = (total + page_size - 1) // page_size
+        next_cursor = None
+        if has_more and responses:
+            last = responses[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        
+        pagination = calculate_pagination(total, 1, page_size, has_more)
+        pagination['has_prev'] = after is not None
         
         return PaginatedResponse(
             data=response_items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            next_cursor=next_cursor,
+            **pagination
         )
 
     async def update_response(
@@ -72,52 +179,106 @@ class ResponseService:
         response_id: UUID,
         response_data: ResponseUpdate
     ) -> ResponseResponse:
-        """Update a response."""
-        existing_response = await self.repository.get_by_id(response_id)
-        if not existing_response:
+        """
+        Update a response. New answers, and the answers of a draft that leaves
+        draft status, are validated against the response's form version.
+        The check runs on the locked, updated row; a failure rolls the update back.
+        """
+        updated = await self.repository.update(response_id, response_data)
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Response not found"
             )
         
-        response = await self.repository.update(response_id, response_data)
-        if not response:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update response"
+        response, previous_status = updated
+        leaving_draft = previous_status == ResponseStatus.DRAFT and response.status != ResponseStatus.DRAFT
+        if response_data.data is not None or leaving_draft:
+            await self._check_answers(
+                response.form_id,
+                response.form_version,
+                response.data or {},
+                partial=response.status == ResponseStatus.DRAFT
             )
         
         return ResponseResponse.model_validate(response)
 
     async def delete_response(self, response_id: UUID) -> bool:
         """Delete a response."""
-        existing_response = await self.repository.get_by_id(response_id)
-        if not existing_response:
+        deleted = await self.repository.delete(response_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Response not found"
             )
         
-        return await self.repository.delete(response_id)
+        return deleted
 
     async def submit_response(self, response_id: UUID) -> ResponseResponse:
-        """Submit a response."""
-        existing_response = await self.repository.get_by_id(response_id)
-        if not existing_response:
+        """
+        Submit a response. All required questions of its form version must be
+        answered; the check runs on the locked, updated row and a failure rolls it back.
+        """
+        updated = await self.repository.submit(response_id)
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Response not found"
             )
         
-        response = await self.repository.submit(response_id)
-        if not response:
+        response, _ = updated
+        await self._check_answers(response.form_id, response.form_version, response.data or {}, partial=False)
+        return ResponseResponse.model_validate(response)
+
+    async def get_response_stats(
+        self,
+        form_id: Optional[UUID] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        interval: Optional[StatsInterval] = None
+    ) -> dict:
+        """Get response statistics."""
+        return await self.repository.get_stats(form_id, date_from, date_to, interval)
+
+    async def get_export_question_ids(self, form_id: UUID) -> List[str]:
+        """Get the question ids of a form, used as CSV export columns."""
+        form = await self.form_repository.get_by_id(form_id)
+        if not form:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to submit response"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Form not found"
             )
+        return [question['id'] for question in form.questions or []]
+
+    async def export_responses(
+        self,
+        export_format: ExportFormat,
+        filters: Optional[ResponseFilter] = None,
+        question_ids: Optional[List[str]] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream responses as CSV or NDJSON chunks, one chunk per cursor batch."""
+        if export_format == ExportFormat.CSV:
+            yield csv_header(question_ids or [])
         
-        return ResponseResponse.model_validate(response)
+        async for rows in self.repository.stream_for_export(filters):
+            if export_format == ExportFormat.CSV:
+                yield csv_chunk(rows, question_ids or [])
+            else:
+                yield ndjson_chunk(rows)
 
-    async def get_response_stats(self, form_id: Optional[UUID] = None) -> dict:
-        """Get response statistics."""
-        return await self.repository.get_stats(form_id)
\ No newline at end of file
+    @staticmethod
+    def _validate_answers(validator: Optional[AnswerValidator], response_data: ResponseCreate) -> List[dict]:
+        """Check answers against the form's questions; drafts may leave required questions unanswered."""
+        if validator is None:
+            return []
+        return validator.validate(response_data.data, partial=response_data.status == ResponseStatus.DRAFT)
+
+    async def _check_answers(self, form_id: UUID, version: int, data: dict, partial: bool) -> None:
+        """Raise 422 if answers do not fit the questions of the given form version."""
+        validator = await self.form_service.get_answer_validator(form_id, version)
+        errors = validator.validate(data, partial=partial) if validator else []
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=errors
+            )
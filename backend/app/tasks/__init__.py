@@ -0,0 +1,15 @@
+from app.tasks.jobs import JOBS, JobFunction, job, execute_job, export_path
+from app.tasks.backends import JobBackend, LocalJobBackend, CeleryJobBackend, create_job_backend, job_backend
+
+__all__ = [
+    "JOBS",
+    "JobFunction",
+    "job",
+    "execute_job",
+    "export_path",
+    "JobBackend",
+    "LocalJobBackend",
+    "CeleryJobBackend",
+    "create_job_backend",
+    "job_backend",
+]
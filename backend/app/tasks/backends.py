@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
+from uuid import uuid4
+import asyncio
+import contextvars
+import logging
+from app.config import settings
+from app.schemas import JobState, JobResponse
+from app.tasks.jobs import JOBS, execute_job
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobBackend:
+    """Interface shared by the job backends."""
+
+    async def submit(self, name: str, params: Dict[str, Any]) -> JobResponse:
+        raise NotImplementedError
+
+    async def get(self, job_id: str) -> Optional[JobResponse]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        if name not in JOBS:
+            raise ValueError(f"Unknown job: {name}")
+
+
+class LocalJobBackend(JobBackend):
+    """
+    Runs jobs as tasks on the application's event loop, at most `concurrency`
+    at a time, so a job holds a pooled connection but not a request handler.
+    With eager, submit() runs the job to completion first (tests, scripts).
+    Job states live in this process only and are bounded to `history_size`.
+    """
+
+    def __init__(self, concurrency: int = 2, eager: bool = False, history_size: int = 1000):
+        self.eager = eager
+        self.history_size = history_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._jobs: "OrderedDict[str, JobResponse]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, name: str, params: Dict[str, Any]) -> JobResponse:
+        self._check_name(name)
+        job = JobResponse(id=uuid4().hex, name=name, state=JobState.PENDING, submitted_at=_now())
+        self._remember(job)
+
+        if self.eager:
+            await self._run(job.id, name, params)
+        else:
+            # A fresh context, so the job's queries are not attributed to the submitting request.
+            task = asyncio.create_task(self._run(job.id, name, params), context=contextvars.Context())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return self._jobs[job.id]
+
+    async def get(self, job_id: str) -> Optional[JobResponse]:
+        return self._jobs.get(job_id)
+
+    async def close(self) -> None:
+        """Cancel unfinished jobs; their transactions roll back."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str, name: str, params: Dict[str, Any]) -> None:
+        async with self._semaphore:
+            self._update(job_id, state=JobState.RUNNING)
+            try:
+                result = await execute_job(name, params)
+            except Exception as e:
+                logger.exception(f"Job {name} ({job_id}) failed")
+                self._update(job_id, state=JobState.FAILED, error=str(e), finished_at=_now())
+            else:
+                self._update(job_id, state=JobState.SUCCEEDED, result=result, finished_at=_now())
+
+    def _remember(self, job: JobResponse) -> None:
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.history_size:
+            self._jobs.popitem(last=False)
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._jobs[job_id] = job.model_copy(update=changes)
+
+
+class CeleryJobBackend(JobBackend):
+    """
+    Sends jobs to Celery workers through REDIS_URL; states are read from the
+    Celery result backend and expire after JOB_RESULT_TTL_SECONDS.
+    Celery reports unknown ids as PENDING, so they are indistinguishable from
+    queued jobs until they expire.
+    """
+
+    STATES = {
+        "PENDING": JobState.PENDING,
+        "RECEIVED": JobState.PENDING,
+        "STARTED": JobState.RUNNING,
+        "RETRY": JobState.RUNNING,
+        "SUCCESS": JobState.SUCCEEDED,
+        "FAILURE": JobState.FAILED,
+        "REVOKED": JobState.FAILED,
+    }
+
+    def __init__(self, app):
+        self.app = app
+
+    async def submit(self, name: str, params: Dict[str, Any]) -> JobResponse:
+        from app.tasks.celery_app import RUN_JOB_TASK
+
+        self._check_name(name)
+        # The Celery client is blocking; keep broker round trips off the event loop.
+        result = await asyncio.to_thread(self.app.send_task, RUN_JOB_TASK, args=[name, params])
+        return JobResponse(id=result.id, name=name, state=JobState.PENDING, submitted_at=_now())
+
+    async def get(self, job_id: str) -> Optional[JobResponse]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    def _get(self, job_id: str) -> JobResponse:
+        result = self.app.AsyncResult(job_id)
+        state = self.STATES.get(result.state, JobState.PENDING)
+        args = result.args or []
+        return JobResponse(
+            id=job_id,
+            name=args[0] if args else None,
+            state=state,
+            result=result.result if state == JobState.SUCCEEDED else None,
+            error=str(result.result) if state == JobState.FAILED else None,
+            finished_at=result.date_done,
+        )
+
+
+def create_job_backend(backend: Optional[str] = None) -> JobBackend:
+    """Create the job backend named by JOB_BACKEND (local or celery)."""
+    backend = (backend or settings.JOB_BACKEND).lower()
+
+    if backend == "celery":
+        from app.tasks.celery_app import celery_app
+
+        return CeleryJobBackend(celery_app)
+
+    if backend == "local":
+        return LocalJobBackend(settings.JOB_CONCURRENCY, settings.JOB_EAGER, settings.JOB_HISTORY_SIZE)
+
+    raise ValueError(f"Unknown job backend: {backend}")
+
+
+job_backend = create_job_backend()
@@ -0,0 +1,50 @@
+"""
+Celery application for JOB_BACKEND=celery.
+
+Start a worker with:
+    celery -A app.tasks.celery_app worker --loglevel=info
+"""
+from typing import Any, Dict, Optional
+import asyncio
+from celery import Celery
+from app.config import settings
+from app.cache import form_cache
+from app.tasks.jobs import execute_job
+
+RUN_JOB_TASK = "app.tasks.run_job"
+
+celery_app = Celery("meyousafe", broker=settings.REDIS_URL, backend=settings.REDIS_URL)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,
+    result_extended=True,
+    result_expires=settings.JOB_RESULT_TTL_SECONDS,
+    worker_prefetch_multiplier=1,
+)
+
+# One event loop per worker process, so the pooled asyncpg connections
+# (bound to the loop that opened them) are reused across tasks.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+async def _run(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    result = await execute_job(name, params)
+    # The loop stops between tasks, so finish post-commit cache invalidation now.
+    await form_cache.drain()
+    return result
+
+
+@celery_app.task(name=RUN_JOB_TASK)
+def run_job(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a registered job on this worker's event loop."""
+    return _event_loop().run_until_complete(_run(name, params))
@@ -0,0 +1,100 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+import os
+import aiofiles
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.cache import form_cache
+from app.repositories import FormRepository, ResponseRepository
+from app.services import ResponseService
+from app.schemas import ExportFormat, ResponseFilter
+
+# A job takes its own session plus JSON-serializable keyword arguments and
+# returns a JSON-serializable result dict.
+JobFunction = Callable[..., Awaitable[Dict[str, Any]]]
+
+JOBS: Dict[str, JobFunction] = {}
+
+
+def job(name: str) -> Callable[[JobFunction], JobFunction]:
+    """Register a job function under `name`."""
+    def register(fn: JobFunction) -> JobFunction:
+        JOBS[name] = fn
+        return fn
+    return register
+
+
+async def execute_job(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a registered job in its own session, committing only if it succeeds."""
+    fn = JOBS.get(name)
+    if fn is None:
+        raise ValueError(f"Unknown job: {name}")
+
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await fn(session, **params)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+    return result
+
+
+def export_path(filename: str) -> str:
+    """Resolve an export file name inside EXPORT_DIR, rejecting any path components."""
+    if os.path.basename(filename) != filename or filename in ('', '.', '..'):
+        raise ValueError(f"Invalid export file name: {filename}")
+    return os.path.join(settings.EXPORT_DIR, filename)
+
+
+@job("rebuild_stats")
+async def rebuild_stats(session: AsyncSession) -> Dict[str, Any]:
+    """Rebuild the response_daily_stats counters from the responses table."""
+    buckets = await ResponseRepository(session).rebuild_stats()
+    return {'buckets': buckets}
+
+
+@job("delete_form")
+async def delete_form(session: AsyncSession, form_id: str) -> Dict[str, Any]:
+    """Delete a form and, through ON DELETE CASCADE, its versions and responses."""
+    deleted = await FormRepository(session).delete(UUID(form_id))
+    if not deleted:
+        raise LookupError("Form not found")
+
+    await form_cache.invalidate_on_commit(session)
+    return {'form_id': form_id}
+
+
+@job("export_responses")
+async def export_responses(
+    session: AsyncSession,
+    filename: str,
+    export_format: str,
+    filters: Dict[str, Any],
+    question_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Write a CSV or NDJSON export to EXPORT_DIR; the file is served by GET /api/jobs/{id}/download.
+    With Celery, EXPORT_DIR must be shared between the workers and the API hosts.
+    """
+    path = export_path(filename)
+    os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+    partial_path = f"{path}.partial"
+    size = 0
+
+    service = ResponseService(session)
+    try:
+        async with aiofiles.open(partial_path, 'wb') as f:
+            async for chunk in service.export_responses(
+                ExportFormat(export_format), ResponseFilter.model_validate(filters), question_ids
+            ):
+                await f.write(chunk)
+                size += len(chunk)
+        os.replace(partial_path, path)
+    except Exception:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    return {'filename': filename, 'format': export_format, 'bytes': size}
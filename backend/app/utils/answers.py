@@ -0,0 +1,114 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from datetime import date
+from app.schemas import FormQuestionSchema
+
+# A check returns an error message for an invalid non-empty answer, or None.
+AnswerCheck = Callable[[Any], Optional[str]]
+
+
+def _error(question_id: str, message: str) -> Dict[str, str]:
+    return {'field': f'data.{question_id}', 'message': message}
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == '' or value == []
+
+
+def _text_check(question: FormQuestionSchema) -> AnswerCheck:
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return "must be text"
+        return None
+    return check
+
+
+def _choice_check(question: FormQuestionSchema) -> AnswerCheck:
+    options = frozenset(question.options or ())
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return "must be one of the options"
+        if options and value not in options:
+            return f"'{value}' is not one of the options"
+        return None
+    return check
+
+
+def _multi_choice_check(question: FormQuestionSchema) -> AnswerCheck:
+    options = frozenset(question.options or ())
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            return "must be a list of options"
+        if options:
+            invalid = [item for item in value if item not in options]
+            if invalid:
+                return f"{', '.join(repr(item) for item in invalid)} not among the options"
+        return None
+    return check
+
+
+def _date_check(question: FormQuestionSchema) -> AnswerCheck:
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return "must be a date (YYYY-MM-DD)"
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return "must be a date (YYYY-MM-DD)"
+        return None
+    return check
+
+
+def _any_check(question: FormQuestionSchema) -> AnswerCheck:
+    return lambda value: None
+
+
+CHECK_BUILDERS: Dict[str, Callable[[FormQuestionSchema], AnswerCheck]] = {
+    'text': _text_check,
+    'textarea': _text_check,
+    'select': _choice_check,
+    'radio': _choice_check,
+    'checkbox': _multi_choice_check,
+    'date': _date_check,
+}
+
+
+class AnswerValidator:
+    """
+    Validates response answers against the questions of one form version.
+    All per-question work (option sets, type checks) is done once here, so
+    validate() is a dictionary walk over the submitted answers.
+    """
+
+    def __init__(self, questions: Sequence[FormQuestionSchema]):
+        self.checks: Dict[str, AnswerCheck] = {
+            question.id: CHECK_BUILDERS.get(question.type, _any_check)(question)
+            for question in questions
+        }
+        self.required = tuple(question.id for question in questions if question.required)
+        self._required_set = frozenset(self.required)
+
+    def validate(self, data: Dict[str, Any], partial: bool = False) -> List[Dict[str, str]]:
+        """
+        Return a list of {'field', 'message'} errors, empty when data is valid.
+        With partial, unanswered required questions are allowed (drafts).
+        """
+        errors = []
+        for question_id, value in data.items():
+            check = self.checks.get(question_id)
+            if check is None:
+                errors.append(_error(question_id, "unknown question"))
+            elif _is_empty(value):
+                if question_id in self._required_set and not partial:
+                    errors.append(_error(question_id, "answer is required"))
+            else:
+                message = check(value)
+                if message:
+                    errors.append(_error(question_id, message))
+
+        if not partial:
+            for question_id in self.required:
+                if question_id not in data:
+                    errors.append(_error(question_id, "answer is required"))
+        return errors
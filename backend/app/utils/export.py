@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Sequence
+from datetime import datetime
+from enum import Enum
+import csv
+import io
+from app.utils.helpers import serialize_json, serialize_json_bytes
+
+EXPORT_COLUMNS = [
+    'id',
+    'form_id',
+    'form_version',
+    'reference_code',
+    'status',
+    'priority',
+    'tags',
+    'notes',
+    'submitted_at',
+    'created_at',
+]
+
+
+def _scalar(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def flatten_answer(value: Any) -> str:
+    """Render an answer as a single CSV cell."""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return '; '.join(str(item) for item in value)
+    if isinstance(value, dict):
+        return serialize_json(value)
+    return str(value)
+
+
+def csv_header(question_ids: List[str]) -> bytes:
+    """Render the CSV header: fixed response columns followed by one column per question."""
+    return csv_rows([EXPORT_COLUMNS + question_ids])
+
+
+def csv_rows(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def csv_chunk(rows: Sequence[Any], question_ids: List[str]) -> bytes:
+    """Render response rows as CSV, flattening `data` into the question columns."""
+    lines = []
+    for row in rows:
+        mapping = row._mapping
+        data = mapping['data'] or {}
+        line = [_scalar(mapping[column]) for column in EXPORT_COLUMNS]
+        line[EXPORT_COLUMNS.index('tags')] = flatten_answer(mapping['tags'])
+        line.extend(flatten_answer(data.get(question_id)) for question_id in question_ids)
+        lines.append(line)
+    return csv_rows(lines)
+
+
+def ndjson_chunk(rows: Sequence[Any]) -> bytes:
+    """Render response rows as newline-delimited JSON."""
+    lines = []
+    for row in rows:
+        record: Dict[str, Any] = {key: _scalar(value) for key, value in row._mapping.items()}
+        lines.append(serialize_json_bytes(record))
+    return b'\n'.join(lines) + b'\n' if lines else b''
@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
-import json
+import orjson
 
 
 def to_dict(obj: Any, exclude: Optional[list] = None) -> Dict[str, Any]:
@@ -27,17 +27,31 @@ def utc_now() -> datetime:
 
 def serialize_json(data: Any) -> str:
     """Safely serialize data to JSON."""
-    return json.dumps(data, default=str)
+    return orjson.dumps(data, default=str).decode("utf-8")
+
+
+def serialize_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes without an intermediate str."""
+    return orjson.dumps(data, default=str)
 
 
 def deserialize_json(data: str) -> Any:
     """Safely deserialize JSON data."""
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(data)
+    except (orjson.JSONDecodeError, TypeError):
         return None
 
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 def sanitize_dict(data: Dict[str, Any], allowed_keys: Optional[list] = None) -> Dict[str, Any]:
     """Sanitize dictionary by removing disallowed keys."""
     if allowed_keys is None:
@@ -46,15 +60,26 @@ def sanitize_dict(data: Dict[str, Any], allowed_keys: Optional[list] = None) ->
     return {k: v for k, v in data.items() if k in allowed_keys}
 
 
-def calculate_pagination(total: int, page: int, page_size: int) -> Dict[str, int]:
-    """Calculate pagination metadata."""
-    total_pages = (total + page_size - 1) // page_size
+def calculate_pagination(
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    has_next: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Calculate pagination metadata.
+    When total is unknown (None), has_next must come from the caller, e.g. by fetching one extra row.
+    """
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
+    
+    if has_next is None:
+        has_next = total_pages is not None and page < total_pages
     
     return {
         'total': total,
         'page': page,
         'page_size': page_size,
         'total_pages': total_pages,
-        'has_next': page < total_pages,
+        'has_next': has_next,
         'has_prev': page > 1,
     }
\ No newline at end of file
@@ -1,22 +1,65 @@
-import random
-import string
+import secrets
 from datetime import datetime
 
+# 32 unambiguous characters: digits and uppercase letters without O, 0, I and 1.
+ALPHABET = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ"
+_INDEX = {char: index for index, char in enumerate(ALPHABET)}
+_BASE = len(ALPHABET)
+_BITS_PER_CHAR = 5
+
+
+def _check_char(payload: str) -> str:
+    """
+    Compute a Luhn mod 32 check character for payload.
+    Catches every single-character typo and most adjacent transpositions.
+    """
+    factor = 2
+    total = 0
+    for char in reversed(payload):
+        addend = factor * _INDEX[char]
+        factor = 1 if factor == 2 else 2
+        total += addend // _BASE + addend % _BASE
+    return ALPHABET[(_BASE - total % _BASE) % _BASE]
+
+
+def _group(code: str) -> str:
+    return '-'.join(code[i:i + 4] for i in range(0, len(code), 4))
+
 
 def generate_reference_code(length: int = 12) -> str:
     """
-    Generate a unique reference code for responses.
+    Generate a reference code for responses.
     Format: XXXX-XXXX-XXXX (alphanumeric, uppercase)
+
+    The first length-1 characters carry 5 random bits each from the OS CSPRNG
+    (55 bits for the default length), the last is a check character. Codes are
+    not looked up before use; the unique index on responses.reference_code is
+    the only guard and inserts retry on conflict.
     """
-    chars = string.ascii_uppercase + string.digits
-    chars = chars.replace('O', '').replace('0', '').replace('I', '').replace('1')
-    
-    code_parts = []
-    for i in range(3):
-        part = ''.join(random.choice(chars) for _ in range(4))
-        code_parts.append(part)
-    
-    return '-'.join(code_parts)
+    return encode_reference_code(secrets.randbits(_BITS_PER_CHAR * (length - 1)), length)
+
+
+def encode_reference_code(value: int, length: int = 12) -> str:
+    """
+    Encode the low 5*(length-1) bits of value as a grouped reference code with
+    its check character. Distinct values below 2**(5*(length-1)) give distinct codes.
+    """
+    chars = []
+    for _ in range(length - 1):
+        chars.append(ALPHABET[value & (_BASE - 1)])
+        value >>= _BITS_PER_CHAR
+    payload = ''.join(chars)
+    return _group(payload + _check_char(payload))
+
+
+def generate_reference_codes(count: int) -> set:
+    """
+    Generate a set of `count` distinct reference codes.
+    """
+    codes = set()
+    while len(codes) < count:
+        codes.add(generate_reference_code())
+    return codes
 
 
 def generate_timestamped_code() -> str:
@@ -25,33 +68,31 @@ def generate_timestamped_code() -> str:
     Format: YYMMDD-XXXX-XXXX
     """
     timestamp = datetime.utcnow().strftime('%y%m%d')
-    
-    chars = string.ascii_uppercase + string.digits
-    chars = chars.replace('O', '').replace('0', '').replace('I', '').replace('1')
-    
+
     code_parts = [timestamp]
     for i in range(2):
-        part = ''.join(random.choice(chars) for _ in range(4))
+        part = ''.join(secrets.choice(ALPHABET) for _ in range(4))
         code_parts.append(part)
-    
+
     return '-'.join(code_parts)
 
 
 def validate_reference_code(code: str) -> bool:
     """
-    Validate reference code format.
+    Validate reference code format and check character.
     """
     if not code:
         return False
-    
+
     parts = code.split('-')
     if len(parts) != 3:
         return False
-    
+
     for part in parts:
         if len(part) != 4:
             return False
-        if not part.isalnum():
+        if any(char not in _INDEX for char in part):
             return False
-    
-    return True
\ No newline at end of file
+
+    payload = ''.join(parts)
+    return _check_char(payload[:-1]) == payload[-1]
@@ -0,0 +1,82 @@
+"""
+Benchmark answer validation against the seeded 10-question form.
+
+Compares the cached compiled validator used by POST /api/responses with
+compiling the question schema on every request. Runs in memory; no database.
+
+Usage:
+    python benchmarks/bench_answer_validation.py --iterations 200000
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.cache import answer_validator_cache
+from app.utils.answers import AnswerValidator
+from scripts.seed_db import DEFAULT_FORM_QUESTIONS
+
+VALID_ANSWERS = {
+    "incident_type": "Bullying",
+    "incident_date": "2026-03-14",
+    "incident_location": "Library, second floor",
+    "incident_description": "A group of students repeatedly blocked the exit and took my bag. " * 3,
+    "perpetrator_known": "Yes",
+    "witness_present": "No",
+    "previous_incidents": "Prefer not to say",
+    "support_needed": ["Counseling", "Legal assistance"],
+    "contact_preference": "Maybe later",
+    "additional_info": "",
+}
+
+INVALID_ANSWERS = {
+    "incident_type": "Something else",
+    "incident_date": "14/03/2026",
+    "incident_description": "",
+    "perpetrator_known": "Yes",
+    "support_needed": ["Counseling", "Money"],
+    "favourite_colour": "blue",
+}
+
+
+def measure(fn, iterations: int) -> float:
+    """Return calls per second of fn over `iterations` runs."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    form_id = uuid.uuid4()
+    validator = answer_validator_cache.compile(form_id, 1, DEFAULT_FORM_QUESTIONS)
+    assert validator.validate(VALID_ANSWERS) == [], validator.validate(VALID_ANSWERS)
+    print(f"invalid answer errors:    {len(validator.validate(INVALID_ANSWERS))}")
+
+    def cached_valid():
+        answer_validator_cache.get(form_id, 1).validate(VALID_ANSWERS)
+
+    def cached_invalid():
+        answer_validator_cache.get(form_id, 1).validate(INVALID_ANSWERS)
+
+    def compile_per_request():
+        AnswerValidator(DEFAULT_FORM_QUESTIONS).validate(VALID_ANSWERS)
+
+    for label, fn in (
+        ("cached, valid answers", cached_valid),
+        ("cached, invalid answers", cached_invalid),
+        ("compiled per request", compile_per_request),
+    ):
+        rate = measure(fn, args.iterations)
+        print(f"{label:<25} {rate:>12,.0f} validations/s ({1_000_000 / rate:.2f} us each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+End-to-end HTTP load benchmark over the application routes.
+
+Loads a deterministic dataset (see datasets.py), then drives each endpoint in
+turn with --concurrency closed-loop clients, either in-process over httpx's
+ASGI transport (--driver asgi) or against a uvicorn server launched for the
+run (--driver uvicorn). Reports p50/p95/p99 latency and throughput per
+endpoint as JSON, so runs can be compared across commits with
+compare_results.py. Rate limiting is disabled for the run.
+
+The submit and update endpoints write to the database. Lookups and updates
+only target generated rows, so the request mix, derived from --seed, is the
+same on every run.
+
+Usage:
+    python benchmarks/bench_http.py --dataset 10k --output results/10k-asgi.json
+    python benchmarks/bench_http.py --dataset 1m --driver uvicorn --workers 4 --concurrency 64
+    python benchmarks/bench_http.py --dataset 10k --endpoints submit update
+"""
+import argparse
+import asyncio
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Settings are read when app.config is imported, so these go first.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+os.environ.setdefault("DEBUG", "False")
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx
+import orjson
+from sqlalchemy import select
+from datasets import DATASETS, DATASET_END, Dataset, ensure_dataset
+from app.database import AsyncSessionLocal, close_db
+from app.models import Response, ResponsePriority
+from scripts.seed_db import DEFAULT_FORM_QUESTIONS, random_answers
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_SIZE = 1000
+
+# method, url, JSON body
+Request = Tuple[str, str, Optional[dict]]
+
+
+@dataclass
+class Context:
+    dataset: Dataset
+    response_ids: List[str]
+    reference_codes: List[str]
+
+
+def active_form(rng: random.Random, ctx: Context) -> Request:
+    return "GET", "/api/forms/active", None
+
+
+def submit(rng: random.Random, ctx: Context) -> Request:
+    answers = random_answers(rng, DEFAULT_FORM_QUESTIONS, datetime.now(timezone.utc).date())
+    return "POST", "/api/responses", {"form_id": str(rng.choice(ctx.dataset.form_ids)), "data": answers}
+
+
+def list_filtered(rng: random.Random, ctx: Context) -> Request:
+    form_id = rng.choice(ctx.dataset.form_ids)
+    status = rng.choice(["submitted", "reviewed"])
+    return "GET", f"/api/responses?form_id={form_id}&status={status}&page_size=20", None
+
+
+def stats(rng: random.Random, ctx: Context) -> Request:
+    return "GET", f"/api/responses/stats?form_id={rng.choice(ctx.dataset.form_ids)}&interval=week", None
+
+
+def get_by_reference(rng: random.Random, ctx: Context) -> Request:
+    return "GET", f"/api/responses/reference/{rng.choice(ctx.reference_codes)}", None
+
+
+def update(rng: random.Random, ctx: Context) -> Request:
+    body = {"priority": rng.choice(list(ResponsePriority)).value, "notes": f"Load test note {rng.randrange(1000)}"}
+    return "PATCH", f"/api/responses/{rng.choice(ctx.response_ids)}", body
+
+
+ENDPOINTS: Dict[str, Callable[[random.Random, Context], Request]] = {
+    "active_form": active_form,
+    "submit": submit,
+    "list_filtered": list_filtered,
+    "stats": stats,
+    "get_by_reference": get_by_reference,
+    "update": update,
+}
+
+
+def percentile(samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    return samples[max(0, math.ceil(p / 100 * len(samples)) - 1)]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+async def load_context(dataset: Dataset) -> Context:
+    """Sample existing responses for the lookup and update endpoints."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Response.id, Response.reference_code)
+            .where(Response.form_id.in_(dataset.form_ids), Response.created_at <= DATASET_END)
+            .order_by(Response.reference_code)
+            .limit(SAMPLE_SIZE)
+        )
+        rows = result.all()
+    return Context(
+        dataset=dataset,
+        response_ids=[str(row.id) for row in rows],
+        reference_codes=[row.reference_code for row in rows],
+    )
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    name: str,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+    seed: int
+) -> Dict[str, Any]:
+    """Issue `requests` requests from `concurrency` clients, each waiting for its previous response."""
+    build = ENDPOINTS[name]
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client_loop(client_id: int) -> None:
+        nonlocal errors
+        rng = random.Random(f"{seed}:{name}:{client_id}")
+        for _ in remaining:
+            method, url, body = build(rng, ctx)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop(i) for i in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def run_all(client: httpx.AsyncClient, ctx: Context, args) -> Dict[str, Any]:
+    results = {}
+    print(f"{'endpoint':<18} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name in args.endpoints:
+        if args.warmup:
+            await run_endpoint(client, name, ctx, args.warmup, args.concurrency, args.seed + 1)
+        result = await run_endpoint(client, name, ctx, args.requests, args.concurrency, args.seed)
+        results[name] = result
+        print(f"{name:<18} {result['throughput_rps']:>9.1f} {result['p50_ms']:>9.2f} "
+              f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7}")
+    return results
+
+
+async def run_asgi(ctx: Context, args) -> Dict[str, Any]:
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await run_all(client, ctx, args)
+
+
+async def wait_until_ready(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            if (await client.get("/api/health/ping")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready in time")
+
+
+async def run_uvicorn(ctx: Context, args) -> Dict[str, Any]:
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+    )
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits) as client:
+            await wait_until_ready(client, server)
+            return await run_all(client, ctx, args)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict[str, Any]:
+    dataset = await ensure_dataset(args.dataset)
+    ctx = await load_context(dataset)
+    # The server opens its own connections; release the loader's before measuring.
+    await close_db()
+
+    print(f"\n Dataset {dataset.name}, driver {args.driver}, concurrency {args.concurrency}, "
+          f"{args.requests} requests per endpoint\n")
+    if args.driver == "uvicorn":
+        endpoints = await run_uvicorn(ctx, args)
+    else:
+        endpoints = await run_asgi(ctx, args)
+    await close_db()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "dataset": dataset.name,
+            "dataset_rows": dataset.rows,
+            "driver": args.driver,
+            "workers": args.workers if args.driver == "uvicorn" else 1,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", choices=list(DATASETS), default="10k")
+    parser.add_argument("--driver", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=200, help="Unmeasured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    body = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "wb") as f:
+            f.write(body)
+        print(f"\n Report written to {args.output}")
+    else:
+        print(body.decode())
+
+
+if __name__ == "__main__":
+    main()
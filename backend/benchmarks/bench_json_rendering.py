@@ -0,0 +1,107 @@
+"""
+Compare JSON rendering paths for GET /api/responses?page_size=100 and GET /api/forms/active.
+
+"before" is FastAPI's default path for a response_model: dump the model,
+re-validate it against the response type, dump it in JSON mode and encode
+with stdlib json. "orjson" keeps that pipeline but encodes with orjson
+(ORJSONResponse). "direct" is model_dump_json, used by the list endpoints.
+The end-to-end numbers drive the application in-process over ASGI.
+
+Usage:
+    python benchmarks/bench_json_rendering.py --rows 10000 --repeat 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx
+import orjson
+from pydantic import TypeAdapter
+from common import ensure_bench_rows, time_async
+from app.main import app
+from app.database import AsyncSessionLocal, close_db
+from app.services import FormService, ResponseService
+from app.schemas import CountMode, FormResponse, PaginatedResponse, ResponseFilter, ResponseListItem
+
+
+def stdlib_dumps(content) -> bytes:
+    # Starlette's JSONResponse.render.
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def render_paths(model, response_type) -> dict:
+    adapter = TypeAdapter(response_type)
+
+    def fastapi_pipeline():
+        validated = adapter.validate_python(model.model_dump(by_alias=True))
+        return adapter.dump_python(validated, mode="json")
+
+    return {
+        "before (json)": lambda: stdlib_dumps(fastapi_pipeline()),
+        "orjson": lambda: orjson.dumps(fastapi_pipeline()),
+        "direct": lambda: model.model_dump_json().encode("utf-8"),
+    }
+
+
+async def time_sync(fn, repeat: int) -> dict:
+    async def call():
+        fn()
+    return await time_async(call, repeat)
+
+
+async def run(rows: int, repeat: int) -> None:
+    form_id = await ensure_bench_rows(rows)
+
+    async with AsyncSessionLocal() as session:
+        page = await ResponseService(session).get_all_responses(
+            1, 100, ResponseFilter(form_id=form_id), CountMode.EXACT
+        )
+        try:
+            active = await FormService(session).get_active_form()
+        except Exception:
+            active = None
+
+    cases = [("GET /api/responses?page_size=100", page, PaginatedResponse[ResponseListItem])]
+    if active is not None:
+        cases.append(("GET /api/forms/active", active, FormResponse))
+    else:
+        print("No active form; run scripts/seed_db.py to include GET /api/forms/active.\n")
+
+    print(f"{'render':<40} {'path':<14} {'p50 us':>10} {'bytes':>8}")
+    for label, model, response_type in cases:
+        for path, fn in render_paths(model, response_type).items():
+            stats = await time_sync(fn, repeat)
+            print(f"{label:<40} {path:<14} {stats['p50_ms'] * 1000:>10.1f} {len(fn()):>8}")
+
+    print(f"\n{'end to end (ASGI)':<40} {'p50 ms':>10} {'max ms':>10}")
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            urls = [f"/api/responses?page_size=100&form_id={form_id}"]
+            if active is not None:
+                urls.append("/api/forms/active")
+            for url in urls:
+                async def get():
+                    response = await client.get(url)
+                    response.raise_for_status()
+                stats = await time_async(get, repeat)
+                print(f"{url.split('?')[0]:<40} {stats['p50_ms']:>10.2f} {stats['max_ms']:>10.2f}")
+
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
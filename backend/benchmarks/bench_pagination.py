@@ -0,0 +1,62 @@
+"""
+Compare offset and keyset (cursor) pagination on GET /api/responses at depth.
+
+Usage:
+    python benchmarks/bench_pagination.py --rows 1000000 --depths 1 100 1000 10000
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from common import ensure_bench_rows, time_async
+from app.database import AsyncSessionLocal, close_db
+from app.repositories import ResponseRepository
+from app.schemas import ResponseFilter
+
+
+async def run(rows: int, page_size: int, depths: list, repeat: int) -> None:
+    form_id = await ensure_bench_rows(rows)
+    filters = ResponseFilter(form_id=form_id)
+
+    async with AsyncSessionLocal() as session:
+        repository = ResponseRepository(session)
+
+        print(f"{'page':>8} {'offset p50 ms':>15} {'cursor p50 ms':>15}")
+        for depth in depths:
+            skip = (depth - 1) * page_size
+            if skip >= rows:
+                continue
+
+            # Find the keyset position that starts page `depth`.
+            after = None
+            if skip:
+                boundary, _, _ = await repository.get_all(skip - 1, 1, filters)
+                after = (boundary[0].created_at, boundary[0].id)
+
+            offset_stats = await time_async(
+                lambda: repository.get_all(skip, page_size, filters), repeat
+            )
+            cursor_stats = await time_async(
+                lambda: repository.get_all_after(after, page_size, filters), repeat
+            )
+            print(f"{depth:>8} {offset_stats['p50_ms']:>15.2f} {cursor_stats['p50_ms']:>15.2f}")
+
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.page_size, args.depths, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure the per-request overhead of the rate limiting middleware.
+
+Drives the ASGI middleware directly around a no-op app, so the numbers
+exclude routing, validation and the database.
+
+Usage:
+    python benchmarks/bench_rate_limit.py --requests 100000
+    python benchmarks/bench_rate_limit.py --redis   # include the Redis sliding window
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.config import settings
+from app.api.middleware.rate_limit import (
+    LocalTokenBucket,
+    RateLimiter,
+    RateLimitMiddleware,
+    RedisSlidingWindow,
+)
+
+
+async def noop_app(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def make_scope(client_index: int) -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/responses",
+        "headers": [],
+        "client": (f"10.0.{client_index // 256 % 256}.{client_index % 256}", 5000),
+    }
+
+
+async def measure(app, requests: int, clients: int) -> float:
+    scopes = [make_scope(i) for i in range(clients)]
+    started = time.perf_counter()
+    for i in range(requests):
+        await app(scopes[i % clients], receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def run(requests: int, clients: int, use_redis: bool) -> None:
+    # A high limit keeps every request on the allow path, which is the common case.
+    route_limits = {("POST", "/api/responses"): 10_000_000}
+
+    shared = RedisSlidingWindow.from_url(settings.REDIS_URL) if use_redis else None
+    limited = RateLimitMiddleware(noop_app, RateLimiter(LocalTokenBucket(), shared), route_limits)
+
+    baseline_us = await measure(noop_app, requests, clients)
+    limited_us = await measure(limited, requests, clients)
+
+    print(f"requests:         {requests}")
+    print(f"clients:          {clients}")
+    print(f"backend:          {'local + redis' if use_redis else 'local'}")
+    print(f"no-op app:        {baseline_us:.2f} us/request")
+    print(f"with rate limit:  {limited_us:.2f} us/request")
+    print(f"overhead:         {limited_us - baseline_us:.2f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--redis", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.clients, args.redis))
+
+
+if __name__ == "__main__":
+    main()
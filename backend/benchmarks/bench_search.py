@@ -0,0 +1,74 @@
+"""
+Compare response search through the full-text index with the previous
+ILIKE '%term%' path on GET /api/responses.
+
+Usage:
+    python benchmarks/bench_search.py --rows 1000000 --terms hallway "teacher shouted"
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from common import ensure_bench_rows, time_async
+from sqlalchemy import select, or_, cast, Text
+from app.database import AsyncSessionLocal, close_db
+from app.models import Response
+from app.repositories import ResponseRepository
+from app.schemas import ResponseFilter, CountMode
+
+
+async def ilike_search(session, form_id, term: str, limit: int):
+    """The search path before the tsvector column, extended to the answers in data."""
+    pattern = f"%{term}%"
+    result = await session.execute(
+        select(Response)
+        .where(Response.form_id == form_id)
+        .where(
+            or_(
+                Response.reference_code.ilike(pattern),
+                Response.notes.ilike(pattern),
+                cast(Response.data, Text).ilike(pattern),
+            )
+        )
+        .order_by(Response.created_at.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def run(rows: int, terms: list, page_size: int, repeat: int) -> None:
+    form_id = await ensure_bench_rows(rows)
+
+    async with AsyncSessionLocal() as session:
+        repository = ResponseRepository(session)
+
+        print(f"{'term':>24} {'ilike p50 ms':>14} {'fts p50 ms':>12}")
+        for term in terms:
+            filters = ResponseFilter(form_id=form_id, search=term)
+            ilike_stats = await time_async(
+                lambda: ilike_search(session, form_id, term, page_size), repeat
+            )
+            fts_stats = await time_async(
+                lambda: repository.get_all(0, page_size, filters, CountMode.NONE), repeat
+            )
+            print(f"{term:>24} {ilike_stats['p50_ms']:>14.2f} {fts_stats['p50_ms']:>12.2f}")
+
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--terms", nargs="+", default=["hallway", "teacher shouted", "dormitory weekend"])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.terms, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import os
+import sys
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import insert, select, func
+from app.database import AsyncSessionLocal
+from app.models import Form, FormVersion, Response, ResponseStatus, ResponsePriority
+from app.utils.reference_code import generate_reference_code
+
+BENCH_FORM_TITLE = "Benchmark Form"
+
+WORDS = (
+    "classroom hallway office bus canteen library dormitory parking field gym "
+    "teacher student manager colleague stranger coach supervisor neighbour "
+    "shouted pushed followed threatened touched insulted excluded recorded "
+    "morning evening weekend lunch break meeting practice party trip"
+).split()
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    """Build a sentence from the benchmark vocabulary."""
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+async def ensure_bench_rows(rows: int, chunk_size: int = 5000) -> uuid.UUID:
+    """
+    Make sure the benchmark form exists and has at least `rows` responses.
+    Returns the benchmark form id.
+    """
+    async with AsyncSessionLocal() as session:
+        form_id = await session.scalar(
+            select(Form.id).where(Form.title == BENCH_FORM_TITLE).limit(1)
+        )
+        if form_id is None:
+            form = Form(
+                id=uuid.uuid4(),
+                title=BENCH_FORM_TITLE,
+                description="Synthetic data for benchmarks",
+                questions=[],
+                is_active=False,
+                version=1,
+            )
+            session.add(form)
+            await session.flush()
+            session.add(FormVersion(
+                form_id=form.id,
+                version=form.version,
+                title=form.title,
+                description=form.description,
+                questions=form.questions,
+            ))
+            await session.flush()
+            form_id = form.id
+
+        existing = await session.scalar(
+            select(func.count()).select_from(Response).where(Response.form_id == form_id)
+        )
+        missing = rows - (existing or 0)
+
+        rng = random.Random(42)
+        statuses = list(ResponseStatus)
+        priorities = list(ResponsePriority)
+        start = datetime.now(timezone.utc) - timedelta(days=365)
+
+        while missing > 0:
+            batch = min(chunk_size, missing)
+            values = [
+                {
+                    "id": uuid.uuid4(),
+                    "form_id": form_id,
+                    "form_version": 1,
+                    "data": {
+                        "incident_location": rng.choice(WORDS),
+                        "incident_description": random_text(rng, 40),
+                    },
+                    "notes": random_text(rng, 8) if rng.random() < 0.3 else None,
+                    "reference_code": generate_reference_code(),
+                    "status": rng.choice(statuses),
+                    "priority": rng.choice(priorities),
+                    "created_at": start + timedelta(seconds=rng.randrange(365 * 86400)),
+                }
+                for _ in range(batch)
+            ]
+            await session.execute(insert(Response.__table__), values)
+            missing -= batch
+
+        await session.commit()
+        return form_id
+
+
+async def time_async(fn: Callable[[], Awaitable], repeat: int = 20) -> Dict[str, float]:
+    """Run an async callable `repeat` times and return latency stats in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    samples.sort()
+    return {
+        "min_ms": samples[0],
+        "p50_ms": statistics.median(samples),
+        "max_ms": samples[-1],
+    }
@@ -0,0 +1,46 @@
+"""
+Compare two bench_http.py JSON reports endpoint by endpoint.
+
+Usage:
+    python benchmarks/compare_results.py results/before.json results/after.json
+"""
+import argparse
+import json
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    for key in ("dataset", "driver", "workers", "concurrency"):
+        if before["meta"].get(key) != after["meta"].get(key):
+            print(f" Warning: {key} differs ({before['meta'].get(key)} vs {after['meta'].get(key)})")
+    print(f" {before['meta'].get('commit')} -> {after['meta'].get('commit')}\n")
+
+    print(f"{'endpoint':<18} {'metric':<15} {'before':>10} {'after':>10} {'change':>9}")
+    for name, result in after["endpoints"].items():
+        previous = before["endpoints"].get(name)
+        if previous is None:
+            continue
+        for metric in METRICS:
+            print(f"{name:<18} {metric:<15} {previous[metric]:>10.2f} {result[metric]:>10.2f} "
+                  f"{change(previous[metric], result[metric]):>9}")
+
+
+if __name__ == "__main__":
+    main()
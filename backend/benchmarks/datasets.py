@@ -0,0 +1,161 @@
+"""
+Generate the deterministic datasets used by the load benchmarks.
+
+A dataset is DATASET_FORMS forms with the default questions and a fixed number
+of responses spread across them. Everything (ids, reference codes, answers,
+statuses, timestamps) comes from a RNG seeded with the dataset name, so the
+same dataset has the same content on every machine. Rows are loaded with the
+seeder's pipelined COPY (scripts/seed_db.py); the stats counters are rebuilt
+and the table analyzed afterwards.
+
+Usage:
+    python benchmarks/datasets.py 10k
+    python benchmarks/datasets.py 1m 10m
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import select, func
+from app.database import AsyncSessionLocal, close_db
+from app.models import Form, FormVersion, Response
+from scripts.seed_db import (
+    DEFAULT_FORM_QUESTIONS,
+    DEFAULT_STATUS_WEIGHTS,
+    DEFAULT_PRIORITY_WEIGHTS,
+    ResponseSpec,
+    bulk_load_responses,
+)
+
+DATASETS = {
+    "10k": 10_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+DATASET_FORMS = 4
+DATASET_FORM_DESCRIPTION = "Deterministic load benchmark dataset"
+DATASET_END = datetime(2026, 1, 1, tzinfo=timezone.utc)
+DATASET_DAYS = 365
+COPY_CHUNK_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    form_ids: List[uuid.UUID]
+    rows: int
+
+
+def dataset_form_title(name: str, index: int) -> str:
+    return f"Load dataset {name} #{index + 1}"
+
+
+def seeded_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def dataset_spec(name: str, form_ids: List[uuid.UUID]) -> ResponseSpec:
+    """
+    The fixed response distribution of a dataset. Seeded with the dataset name;
+    reference codes embed the dataset and row index, so they never collide.
+    """
+    return ResponseSpec(
+        form_ids=tuple(form_ids),
+        form_version=1,
+        questions=tuple(DEFAULT_FORM_QUESTIONS),
+        status_weights=tuple(DEFAULT_STATUS_WEIGHTS.items()),
+        priority_weights=tuple(DEFAULT_PRIORITY_WEIGHTS.items()),
+        end=DATASET_END,
+        days=DATASET_DAYS,
+        seed=name,
+        code_namespace=list(DATASETS).index(name) + 1,
+    )
+
+
+async def ensure_forms(name: str) -> List[uuid.UUID]:
+    """Create the dataset's forms if missing; the first one is activated when no form is active."""
+    rng = random.Random(f"{name}:forms")
+    form_ids = [seeded_uuid(rng) for _ in range(DATASET_FORMS)]
+    questions = [question.model_dump() for question in DEFAULT_FORM_QUESTIONS]
+
+    async with AsyncSessionLocal() as session:
+        existing = set(await session.scalars(select(Form.id).where(Form.id.in_(form_ids))))
+        has_active = await session.scalar(select(func.count()).select_from(Form).where(Form.is_active == True))
+        for index, form_id in enumerate(form_ids):
+            if form_id in existing:
+                continue
+            title = dataset_form_title(name, index)
+            session.add(Form(
+                id=form_id,
+                title=title,
+                description=DATASET_FORM_DESCRIPTION,
+                questions=questions,
+                is_active=index == 0 and not has_active,
+                version=1,
+            ))
+            await session.flush()
+            session.add(FormVersion(
+                form_id=form_id,
+                version=1,
+                title=title,
+                description=DATASET_FORM_DESCRIPTION,
+                questions=questions,
+            ))
+        await session.commit()
+    return form_ids
+
+
+async def count_rows(form_ids: List[uuid.UUID]) -> int:
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(func.count()).select_from(Response).where(Response.form_id.in_(form_ids))
+        )
+
+
+async def load_rows(name: str, form_ids: List[uuid.UUID], rows: int) -> None:
+    """Replace the dataset's responses with a fresh bulk load."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            Response.__table__.delete().where(Response.form_id.in_(form_ids))
+        )
+        await session.commit()
+    await bulk_load_responses(dataset_spec(name, form_ids), rows, chunk_size=COPY_CHUNK_SIZE)
+
+
+async def ensure_dataset(name: str) -> Dataset:
+    """Create dataset `name` unless it is already loaded. Returns its forms and size."""
+    if name not in DATASETS:
+        raise ValueError(f"Unknown dataset: {name} (expected one of {', '.join(DATASETS)})")
+    rows = DATASETS[name]
+    form_ids = await ensure_forms(name)
+
+    # Benchmarks add rows through the submit endpoint, so more rows than planned is fine.
+    if await count_rows(form_ids) < rows:
+        print(f" Loading dataset {name} ({rows:,} responses)...")
+        await load_rows(name, form_ids, rows)
+    return Dataset(name=name, form_ids=form_ids, rows=rows)
+
+
+async def main(names: List[str]) -> None:
+    for name in names:
+        started = time.perf_counter()
+        dataset = await ensure_dataset(name)
+        print(f" Dataset {dataset.name}: {dataset.rows:,} responses across {len(dataset.form_ids)} forms "
+              f"({time.perf_counter() - started:.1f}s)")
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("datasets", nargs="+", choices=list(DATASETS))
+    args = parser.parse_args()
+    asyncio.run(main(args.datasets))
@@ -0,0 +1,36 @@
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import AsyncSessionLocal, close_db
+from app.repositories import ResponseRepository
+
+
+async def rebuild_stats():
+    """Rebuild the response_daily_stats counters from the responses table."""
+    async with AsyncSessionLocal() as session:
+        try:
+            repository = ResponseRepository(session)
+            buckets = await repository.rebuild_stats()
+            await session.commit()
+            
+            print(f" Rebuilt {buckets} stats buckets")
+            
+        except Exception as e:
+            print(f" Error rebuilding stats: {str(e)}")
+            await session.rollback()
+            raise
+
+
+async def main():
+    """Main function to rebuild response statistics."""
+    print(" Rebuilding response statistics...")
+    await rebuild_stats()
+    await close_db()
+    print("\n Statistics rebuild completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
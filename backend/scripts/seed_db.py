@@ -1,121 +1,345 @@
+"""
+Seed the database with the default form, and optionally bulk responses.
+
+Usage:
+    python scripts/seed_db.py
+    python scripts/seed_db.py --responses 1000000
+    python scripts/seed_db.py --responses 5000000 --status-weights submitted=50,reviewed=40,closed=10 \
+        --priority-weights low=10,medium=60,high=25,urgent=5 --timestamps recent --days 180
+"""
+import argparse
 import asyncio
-import sys
+import enum
 import os
+import random
+import secrets
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from app.database import AsyncSessionLocal, init_db
-from app.models import Form
-from app.schemas import FormQuestionSchema
-import uuid
+from sqlalchemy import text
+from app.database import AsyncSessionLocal, engine, check_schema_version, close_db
+from app.models import Response, ResponseStatus, ResponsePriority
+from app.repositories import FormRepository, ResponseRepository
+from app.schemas import FormCreate, FormQuestionSchema
+from app.utils.helpers import serialize_json
+from app.utils.reference_code import encode_reference_code
+
+DEFAULT_FORM_QUESTIONS = [
+    FormQuestionSchema(
+        id="incident_type",
+        question="What type of incident are you reporting?",
+        type="select",
+        required=True,
+        options=[
+            "Sexual Harassment",
+            "Sexual Assault",
+            "Discrimination",
+            "Bullying",
+            "Other"
+        ],
+        helper_text="Select the category that best describes the incident"
+    ),
+    FormQuestionSchema(
+        id="incident_date",
+        question="When did this incident occur?",
+        type="date",
+        required=True,
+        helper_text="Approximate date if you don't remember the exact date"
+    ),
+    FormQuestionSchema(
+        id="incident_location",
+        question="Where did this incident occur?",
+        type="text",
+        required=True,
+        placeholder="e.g., School, Workplace, Public Place",
+        helper_text="Be as specific as you feel comfortable"
+    ),
+    FormQuestionSchema(
+        id="incident_description",
+        question="Please describe what happened",
+        type="textarea",
+        required=True,
+        placeholder="Describe the incident in as much detail as you're comfortable sharing...",
+        helper_text="Your safety is our priority. Share only what you feel comfortable sharing"
+    ),
+    FormQuestionSchema(
+        id="perpetrator_known",
+        question="Do you know the person(s) involved?",
+        type="radio",
+        required=True,
+        options=["Yes", "No", "Prefer not to say"]
+    ),
+    FormQuestionSchema(
+        id="witness_present",
+        question="Were there any witnesses?",
+        type="radio",
+        required=False,
+        options=["Yes", "No", "I don't know"]
+    ),
+    FormQuestionSchema(
+        id="previous_incidents",
+        question="Has this happened before?",
+        type="radio",
+        required=False,
+        options=["Yes", "No", "Prefer not to say"]
+    ),
+    FormQuestionSchema(
+        id="support_needed",
+        question="What kind of support would be most helpful?",
+        type="checkbox",
+        required=False,
+        options=[
+            "Counseling",
+            "Legal assistance",
+            "Medical help",
+            "Safety planning",
+            "Just want to report"
+        ]
+    ),
+    FormQuestionSchema(
+        id="contact_preference",
+        question="Would you like someone to contact you?",
+        type="radio",
+        required=False,
+        options=["Yes", "No", "Maybe later"]
+    ),
+    FormQuestionSchema(
+        id="additional_info",
+        question="Is there anything else you'd like to share?",
+        type="textarea",
+        required=False,
+        placeholder="Any additional information that might be helpful..."
+    )
+]
+
+
+DEFAULT_STATUS_WEIGHTS = {
+    ResponseStatus.DRAFT: 5,
+    ResponseStatus.SUBMITTED: 60,
+    ResponseStatus.REVIEWED: 25,
+    ResponseStatus.CLOSED: 10,
+}
+DEFAULT_PRIORITY_WEIGHTS = {
+    ResponsePriority.LOW: 20,
+    ResponsePriority.MEDIUM: 50,
+    ResponsePriority.HIGH: 25,
+    ResponsePriority.URGENT: 5,
+}
+
+WORDS = (
+    "classroom hallway office bus canteen library dormitory parking field gym "
+    "teacher student manager colleague stranger coach supervisor neighbour "
+    "shouted pushed followed threatened touched insulted excluded recorded "
+    "morning evening weekend lunch break meeting practice party trip"
+).split()
+
+COPY_COLUMNS = [
+    'id', 'form_id', 'form_version', 'data', 'reference_code', 'status', 'priority',
+    'tags', 'metadata', 'notes', 'submitted_at', 'created_at', 'updated_at',
+]
+REFERENCE_CODE_BITS = 55
+COPY_ATTEMPTS = 3
+
+
+class TimestampDistribution(str, enum.Enum):
+    UNIFORM = "uniform"
+    RECENT = "recent"
+
+
+@dataclass(frozen=True)
+class ResponseSpec:
+    """
+    What bulk-generated responses look like. Picklable, so chunks can be
+    generated in worker processes; chunk contents depend only on the spec,
+    the chunk start and the seed.
+    """
+    form_ids: Tuple[UUID, ...]
+    form_version: int
+    questions: Tuple[FormQuestionSchema, ...]
+    status_weights: Tuple[Tuple[ResponseStatus, float], ...]
+    priority_weights: Tuple[Tuple[ResponsePriority, float], ...]
+    end: datetime
+    days: int = 365
+    timestamps: TimestampDistribution = TimestampDistribution.UNIFORM
+    seed: str = "seed"
+    # When set, reference codes embed (namespace, row index) and cannot collide
+    # within or across namespaces; otherwise they are 55 random bits.
+    code_namespace: Optional[int] = None
+
+
+def parse_weights(value: str, enum_type) -> Tuple[Tuple[Any, float], ...]:
+    """Parse 'name=weight,...' into (member, weight) pairs, e.g. 'submitted=60,draft=5'."""
+    weights = []
+    for item in value.split(','):
+        name, separator, weight = item.partition('=')
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected name=weight, got '{item}'")
+        try:
+            weights.append((enum_type(name.strip().lower()), float(weight)))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight '{item}' for {enum_type.__name__}")
+    if not any(weight > 0 for _, weight in weights):
+        raise argparse.ArgumentTypeError("At least one weight must be positive")
+    return tuple(weights)
+
+
+def random_answers(rng: random.Random, questions: Sequence[FormQuestionSchema], incident_day: date) -> Dict[str, Any]:
+    """Answer every required question and most optional ones with values the form accepts."""
+    answers = {}
+    for question in questions:
+        if not question.required and rng.random() < 0.3:
+            continue
+        if question.type in ('select', 'radio') and question.options:
+            answers[question.id] = rng.choice(question.options)
+        elif question.type == 'checkbox' and question.options:
+            answers[question.id] = rng.sample(question.options, rng.randint(1, min(3, len(question.options))))
+        elif question.type == 'date':
+            answers[question.id] = incident_day.isoformat()
+        elif question.type == 'textarea':
+            answers[question.id] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(15, 60)))
+        else:
+            answers[question.id] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+    return answers
+
+
+def _seconds_ago(rng: random.Random, spec: ResponseSpec) -> int:
+    window = spec.days * 86400
+    if spec.timestamps == TimestampDistribution.RECENT:
+        # Exponential with a quarter of the window as mean, truncated to the window.
+        return min(int(rng.expovariate(4 / window)), window - 1)
+    return rng.randrange(window)
+
+
+def generate_records(spec: ResponseSpec, start: int, count: int) -> List[tuple]:
+    """Build COPY records for rows [start, start + count) of a bulk load."""
+    rng = random.Random(f"{spec.seed}:{start}")
+    statuses, status_weights = zip(*spec.status_weights)
+    priorities, priority_weights = zip(*spec.priority_weights)
+
+    records = []
+    for index in range(start, start + count):
+        created_at = spec.end - timedelta(seconds=_seconds_ago(rng, spec))
+        incident_day = (created_at - timedelta(days=rng.randrange(30))).date()
+        status = rng.choices(statuses, status_weights)[0]
+        if spec.code_namespace is None:
+            code = rng.getrandbits(REFERENCE_CODE_BITS)
+        else:
+            code = (spec.code_namespace << 52) | (index << 28) | rng.getrandbits(28)
+        records.append((
+            UUID(int=rng.getrandbits(128), version=4),
+            spec.form_ids[index % len(spec.form_ids)],
+            spec.form_version,
+            serialize_json(random_answers(rng, spec.questions, incident_day)),
+            encode_reference_code(code),
+            status.name,
+            rng.choices(priorities, priority_weights)[0].name,
+            '[]',
+            '{}',
+            " ".join(rng.choice(WORDS) for _ in range(8)) if rng.random() < 0.2 else None,
+            created_at + timedelta(minutes=rng.randrange(60)) if status != ResponseStatus.DRAFT else None,
+            created_at,
+            created_at,
+        ))
+    return records
+
+
+async def _copy_chunk(raw_connection, records: List[tuple]) -> None:
+    """COPY one chunk in its own transaction; on a reference code clash, retry with fresh codes."""
+    for attempt in range(COPY_ATTEMPTS):
+        try:
+            async with raw_connection.transaction():
+                await raw_connection.copy_records_to_table(
+                    Response.__tablename__, records=records, columns=COPY_COLUMNS
+                )
+            return
+        except Exception as e:
+            if getattr(e, 'sqlstate', None) != '23505' or attempt == COPY_ATTEMPTS - 1:
+                raise
+            code_index = COPY_COLUMNS.index('reference_code')
+            records = [
+                (*record[:code_index], encode_reference_code(secrets.randbits(REFERENCE_CODE_BITS)), *record[code_index + 1:])
+                for record in records
+            ]
+
+
+async def bulk_load_responses(
+    spec: ResponseSpec,
+    total: int,
+    chunk_size: int = 50_000,
+    connections: int = 4,
+    processes: Optional[int] = None
+) -> None:
+    """
+    Generate and COPY `total` responses, pipelined: worker processes build
+    chunks ahead while `connections` connections each COPY one chunk at a time.
+    Each chunk commits on its own, so an interrupted load leaves whole chunks.
+    The daily stats counters are rebuilt and the table analyzed at the end.
+    """
+    processes = processes or os.cpu_count() or 1
+    queue: asyncio.Queue = asyncio.Queue(maxsize=connections * 2)
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    loaded = 0
+
+    async def produce(pool: ProcessPoolExecutor) -> None:
+        pending = deque()
+        for start in range(0, total, chunk_size):
+            pending.append(loop.run_in_executor(pool, generate_records, spec, start, min(chunk_size, total - start)))
+            if len(pending) >= processes:
+                await queue.put(await pending.popleft())
+        while pending:
+            await queue.put(await pending.popleft())
+        for _ in range(connections):
+            await queue.put(None)
+
+    async def consume() -> None:
+        nonlocal loaded
+        async with engine.connect() as connection:
+            raw_connection = (await connection.get_raw_connection()).driver_connection
+            while (records := await queue.get()) is not None:
+                await _copy_chunk(raw_connection, records)
+                loaded += len(records)
+                print(f"  {loaded:>12,} / {total:,} rows ({loaded / (time.perf_counter() - started):,.0f} rows/s)", end="\r")
+
+    with ProcessPoolExecutor(processes) as pool:
+        tasks = [asyncio.create_task(produce(pool))]
+        tasks += [asyncio.create_task(consume()) for _ in range(connections)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    print()
+
+    async with AsyncSessionLocal() as session:
+        await ResponseRepository(session).rebuild_stats()
+        await session.execute(text(f"ANALYZE {Response.__tablename__}"))
+        await session.commit()
 
 
 async def seed_forms():
     """Seed the database with default forms."""
     async with AsyncSessionLocal() as session:
         try:
-            questions = [
-                FormQuestionSchema(
-                    id="incident_type",
-                    question="What type of incident are you reporting?",
-                    type="select",
-                    required=True,
-                    options=[
-                        "Sexual Harassment",
-                        "Sexual Assault",
-                        "Discrimination",
-                        "Bullying",
-                        "Other"
-                    ],
-                    helper_text="Select the category that best describes the incident"
-                ),
-                FormQuestionSchema(
-                    id="incident_date",
-                    question="When did this incident occur?",
-                    type="date",
-                    required=True,
-                    helper_text="Approximate date if you don't remember the exact date"
-                ),
-                FormQuestionSchema(
-                    id="incident_location",
-                    question="Where did this incident occur?",
-                    type="text",
-                    required=True,
-                    placeholder="e.g., School, Workplace, Public Place",
-                    helper_text="Be as specific as you feel comfortable"
-                ),
-                FormQuestionSchema(
-                    id="incident_description",
-                    question="Please describe what happened",
-                    type="textarea",
-                    required=True,
-                    placeholder="Describe the incident in as much detail as you're comfortable sharing...",
-                    helper_text="Your safety is our priority. Share only what you feel comfortable sharing"
-                ),
-                FormQuestionSchema(
-                    id="perpetrator_known",
-                    question="Do you know the person(s) involved?",
-                    type="radio",
-                    required=True,
-                    options=["Yes", "No", "Prefer not to say"]
-                ),
-                FormQuestionSchema(
-                    id="witness_present",
-                    question="Were there any witnesses?",
-                    type="radio",
-                    required=False,
-                    options=["Yes", "No", "I don't know"]
-                ),
-                FormQuestionSchema(
-                    id="previous_incidents",
-                    question="Has this happened before?",
-                    type="radio",
-                    required=False,
-                    options=["Yes", "No", "Prefer not to say"]
-                ),
-                FormQuestionSchema(
-                    id="support_needed",
-                    question="What kind of support would be most helpful?",
-                    type="checkbox",
-                    required=False,
-                    options=[
-                        "Counseling",
-                        "Legal assistance",
-                        "Medical help",
-                        "Safety planning",
-                        "Just want to report"
-                    ]
-                ),
-                FormQuestionSchema(
-                    id="contact_preference",
-                    question="Would you like someone to contact you?",
-                    type="radio",
-                    required=False,
-                    options=["Yes", "No", "Maybe later"]
-                ),
-                FormQuestionSchema(
-                    id="additional_info",
-                    question="Is there anything else you'd like to share?",
-                    type="textarea",
-                    required=False,
-                    placeholder="Any additional information that might be helpful..."
-                )
-            ]
-            
-            default_form = Form(
-                id=uuid.uuid4(),
+            default_form = await FormRepository(session).create(FormCreate(
                 title="Anonymous Incident Report",
                 description="This form allows you to report incidents of harassment, assault, or other safety concerns anonymously and securely.",
-                questions=[q.model_dump() for q in questions],
-                is_active=True,
-                version=1
-            )
-            
-            session.add(default_form)
+                questions=DEFAULT_FORM_QUESTIONS,
+                is_active=True
+            ))
             await session.commit()
             
             print(f" Successfully created default form with ID: {default_form.id}")
-            print(f" Form has {len(questions)} questions")
+            print(f" Form has {len(DEFAULT_FORM_QUESTIONS)} questions")
             
         except Exception as e:
             print(f" Error seeding database: {str(e)}")
@@ -123,16 +347,80 @@ async def seed_forms():
             raise
 
 
-async def main():
+async def seed_responses(args) -> None:
+    """Bulk-load responses for the active form, seeding the default form first if none is active."""
+    async with AsyncSessionLocal() as session:
+        form = await FormRepository(session).get_active()
+    if form is None:
+        await seed_forms()
+        async with AsyncSessionLocal() as session:
+            form = await FormRepository(session).get_active()
+    
+    spec = ResponseSpec(
+        form_ids=(form.id,),
+        form_version=form.version,
+        questions=tuple(FormQuestionSchema.model_validate(question) for question in form.questions or []),
+        status_weights=args.status_weights,
+        priority_weights=args.priority_weights,
+        end=args.end or datetime.now(timezone.utc),
+        days=args.days,
+        timestamps=args.timestamps,
+        seed=str(args.seed if args.seed is not None else secrets.randbits(64)),
+    )
+    print(f" Loading {args.responses:,} responses for form {form.id} (version {form.version})...")
+    started = time.perf_counter()
+    await bulk_load_responses(spec, args.responses, args.chunk_size, args.connections, args.processes)
+    elapsed = time.perf_counter() - started
+    print(f" Loaded {args.responses:,} responses in {elapsed:.1f}s ({args.responses / elapsed:,.0f} rows/s)")
+
+
+def parse_end(value: str) -> datetime:
+    end = datetime.fromisoformat(value)
+    return end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--responses", type=int, default=0, help="Bulk-load this many responses for the active form")
+    parser.add_argument(
+        "--status-weights",
+        type=lambda value: parse_weights(value, ResponseStatus),
+        default=tuple(DEFAULT_STATUS_WEIGHTS.items()),
+        help="e.g. submitted=60,reviewed=25,closed=10,draft=5"
+    )
+    parser.add_argument(
+        "--priority-weights",
+        type=lambda value: parse_weights(value, ResponsePriority),
+        default=tuple(DEFAULT_PRIORITY_WEIGHTS.items()),
+        help="e.g. low=20,medium=50,high=25,urgent=5"
+    )
+    parser.add_argument("--timestamps", type=TimestampDistribution, choices=list(TimestampDistribution),
+                        default=TimestampDistribution.UNIFORM, help="created_at distribution over the window")
+    parser.add_argument("--days", type=int, default=365, help="Length of the created_at window")
+    parser.add_argument("--end", type=parse_end,
+                        help="End of the created_at window (UTC, default now)")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible data")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--connections", type=int, default=4, help="Concurrent COPY connections")
+    parser.add_argument("--processes", type=int, help="Generator processes (default: CPU count)")
+    return parser.parse_args()
+
+
+async def main(args):
     """Main function to initialize and seed database."""
-    print(" Initializing database...")
-    await init_db()
-    print(" Database initialized")
+    print(" Checking database schema...")
+    await check_schema_version()
+    print(" Database schema is up to date")
     
-    print("\n Seeding forms...")
-    await seed_forms()
+    if args.responses:
+        print("\n Seeding responses...")
+        await seed_responses(args)
+    else:
+        print("\n Seeding forms...")
+        await seed_forms()
+    await close_db()
     print("\n Database seeding completed!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,72 @@
+import asyncio
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Settings are read when app.config is imported, so these go first.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+
+import httpx
+import pytest
+from app.database import engine, check_schema_version, close_db
+from app.metrics import QueryStats, track_queries, track_engine_queries
+
+
+async def _database_unavailable() -> Optional[str]:
+    """Return why the Postgres tests cannot run, or None when the database is ready."""
+    try:
+        await check_schema_version()
+    except Exception as e:
+        return f"Postgres at DATABASE_URL is not available: {e}"
+    finally:
+        await close_db()
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    postgres_items = [item for item in items if item.get_closest_marker("postgres")]
+    if not postgres_items:
+        return
+
+    reason = asyncio.run(_database_unavailable())
+    if reason:
+        for item in postgres_items:
+            item.add_marker(pytest.mark.skip(reason=reason))
+
+
+@pytest.fixture(autouse=True)
+async def dispose_engine():
+    """Pooled connections belong to the test's event loop; drop them after each test."""
+    yield
+    await close_db()
+
+
+@pytest.fixture
+async def client() -> httpx.AsyncClient:
+    """HTTP client driving the application in-process, with its lifespan running."""
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when the wrapped block issues more than `n` SQL statements:
+
+        with query_budget(2):
+            await client.get(...)
+    """
+    track_engine_queries(engine)
+
+    @contextmanager
+    def budget(n: int) -> Iterator[QueryStats]:
+        with track_queries(keep_statements=True) as stats:
+            yield stats
+        statements = "\n".join(f"    {' '.join(statement.split())[:160]}" for statement in stats.statements)
+        assert stats.count <= n, f"{stats.count} statements, budget {n}:\n{statements}"
+
+    return budget
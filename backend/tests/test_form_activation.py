@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from sqlalchemy import select, func, delete
+from app.database import AsyncSessionLocal
+from app.models import Form
+from app.repositories import FormRepository
+from app.schemas import FormCreate, FormQuestionSchema
+
+pytestmark = pytest.mark.postgres
+
+CONCURRENT_ACTIVATIONS = 20
+ROUNDS = 5
+
+
+async def activate(form_id) -> None:
+    """Activate one form in its own session and transaction."""
+    async with AsyncSessionLocal() as session:
+        await FormRepository(session).activate(form_id)
+        await session.commit()
+
+
+async def count_active() -> int:
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(select(func.count()).select_from(Form).where(Form.is_active == True))
+
+
+@pytest.fixture
+async def candidate_form_ids():
+    """Inactive forms to activate concurrently; the previously active form is restored afterwards."""
+    question = FormQuestionSchema(id="q1", question="Check", type="text", required=False)
+    async with AsyncSessionLocal() as session:
+        repository = FormRepository(session)
+        previously_active = await repository.get_active()
+        forms = [
+            await repository.create(
+                FormCreate(title=f"Activation check {i}", questions=[question], is_active=False)
+            )
+            for i in range(CONCURRENT_ACTIVATIONS)
+        ]
+        await session.commit()
+    form_ids = [form.id for form in forms]
+
+    yield form_ids
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(Form).where(Form.id.in_(form_ids)))
+        await session.commit()
+    if previously_active:
+        await activate(previously_active.id)
+
+
+async def test_concurrent_activations_leave_one_active_form(candidate_form_ids):
+    for _ in range(ROUNDS):
+        results = await asyncio.gather(
+            *(activate(form_id) for form_id in candidate_form_ids),
+            return_exceptions=True
+        )
+
+        # A violation of ex_forms_single_active would surface here as an IntegrityError.
+        assert [r for r in results if isinstance(r, Exception)] == []
+        assert await count_active() == 1
@@ -0,0 +1,94 @@
+"""
+Statement budgets per endpoint, measured on the cold path (caches cleared
+before each request). An extra round trip added in app/repositories/ fails here.
+"""
+import pytest
+from app.cache import form_cache
+from app.repositories.counting import count_cache
+
+pytestmark = pytest.mark.postgres
+
+QUESTIONS = [{"id": "q1", "question": "Check", "type": "text", "required": False}]
+
+# (method, path template, JSON body, maximum statements, form active before the request).
+# Paths and bodies are formatted with the ids of the form and draft response set up per test.
+BUDGETS = [
+    pytest.param("POST", "/api/forms", "form", 3, False, id="create form"),
+    pytest.param("GET", "/api/forms/{form_id}", None, 1, False, id="get form"),
+    pytest.param("GET", "/api/forms?count=exact", None, 2, False, id="list forms"),
+    pytest.param("PATCH", "/api/forms/{form_id}", {"title": "Query budget check (edited)"}, 2, False, id="update form content"),
+    pytest.param("GET", "/api/forms/{form_id}/versions/2", None, 1, False, id="get form version"),
+    pytest.param("POST", "/api/forms/{form_id}/activate", None, 2, False, id="activate form"),
+    pytest.param("GET", "/api/forms/active", None, 1, True, id="get active form"),
+    pytest.param("POST", "/api/responses", "response", 3, False, id="create response"),
+    pytest.param("POST", "/api/responses/batch", "batch", 4, False, id="create response batch"),
+    pytest.param("GET", "/api/responses/{response_id}", None, 1, False, id="get response"),
+    pytest.param("GET", "/api/responses/reference/{reference_code}", None, 1, False, id="get by reference"),
+    pytest.param("GET", "/api/responses?form_id={form_id}&count=exact", None, 2, False, id="list responses"),
+    pytest.param("GET", "/api/responses?form_id={form_id}&count=none", None, 1, False, id="list responses (no count)"),
+    pytest.param("PATCH", "/api/responses/{response_id}", {"status": "reviewed", "priority": "high"}, 2, False, id="update response"),
+    pytest.param("PATCH", "/api/responses/{response_id}", {"notes": "checked"}, 1, False, id="update response notes"),
+    pytest.param("POST", "/api/responses/{response_id}/submit", None, 2, False, id="submit response"),
+    pytest.param("GET", "/api/responses/stats?form_id={form_id}", None, 1, False, id="response stats"),
+    pytest.param("GET", "/api/responses/stats?form_id={form_id}&interval=day", None, 2, False, id="response stats timeline"),
+    pytest.param("DELETE", "/api/responses/{response_id}", None, 2, False, id="delete response"),
+    pytest.param("POST", "/api/forms/{form_id}/deactivate", None, 1, True, id="deactivate form"),
+    pytest.param("DELETE", "/api/forms/{form_id}", None, 1, False, id="delete form"),
+]
+
+
+def request_body(kind, ids: dict):
+    if kind == "form":
+        return {"title": "Query budget check", "questions": QUESTIONS, "is_active": False}
+    if kind == "response":
+        return {"form_id": ids["form_id"], "data": {"q1": "answer"}, "status": "draft"}
+    if kind == "batch":
+        return {"items": [{"form_id": ids["form_id"], "data": {"q1": f"answer {i}"}} for i in range(3)]}
+    return kind
+
+
+@pytest.fixture
+async def budget_ids(client):
+    """
+    Create a form at version 2 with one draft response. The previously active
+    form is restored and every form created by the test is deleted afterwards.
+    """
+    active = await client.get("/api/forms/active")
+    previously_active = active.json()["id"] if active.status_code == 200 else None
+
+    created = await client.post("/api/forms", json=request_body("form", {}))
+    assert created.status_code < 400, created.text
+    ids = {"form_id": created.json()["id"], "created_forms": [created.json()["id"]]}
+    try:
+        edited = await client.patch(f"/api/forms/{ids['form_id']}", json={"title": "Query budget check v2"})
+        assert edited.status_code < 400, edited.text
+        response = await client.post("/api/responses", json=request_body("response", ids))
+        assert response.status_code < 400, response.text
+        ids["response_id"] = response.json()["id"]
+        ids["reference_code"] = response.json()["reference_code"]
+        yield ids
+    finally:
+        if previously_active:
+            await client.post(f"/api/forms/{previously_active}/activate")
+        for form_id in ids["created_forms"]:
+            await client.delete(f"/api/forms/{form_id}")
+
+
+async def reset_caches() -> None:
+    await form_cache.invalidate()
+    count_cache.clear()
+
+
+@pytest.mark.parametrize("method, path, body, budget, active", BUDGETS)
+async def test_endpoint_query_budget(client, query_budget, budget_ids, method, path, body, budget, active):
+    if active:
+        activated = await client.post(f"/api/forms/{budget_ids['form_id']}/activate")
+        assert activated.status_code < 400, activated.text
+    await reset_caches()
+
+    with query_budget(budget):
+        response = await client.request(method, path.format(**budget_ids), json=request_body(body, budget_ids))
+
+    assert response.status_code < 400, response.text
+    if body == "form":
+        budget_ids["created_forms"].append(response.json()["id"])
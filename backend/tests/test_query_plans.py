@@ -0,0 +1,79 @@
+"""
+Response list queries must be served by their composite indexes as ordered
+index scans; a Sort node means an index no longer matches its query shape.
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+import pytest
+from sqlalchemy import event, text
+from app.database import AsyncSessionLocal
+from app.models import ResponseStatus
+from app.repositories import ResponseRepository
+from app.repositories.counting import Explain
+from app.schemas import CountMode, ResponseFilter
+
+pytestmark = pytest.mark.postgres
+
+FORM_ID = uuid.uuid4()
+CURSOR = (datetime.now(timezone.utc), uuid.uuid4())
+
+# (filters, keyset position, index the plan must use)
+LIST_QUERY_SHAPES = [
+    pytest.param(None, None, "ix_responses_created_at_id", id="all responses"),
+    pytest.param(ResponseFilter(form_id=FORM_ID), None, "ix_responses_form_created", id="by form"),
+    pytest.param(
+        ResponseFilter(form_id=FORM_ID, status=ResponseStatus.REVIEWED),
+        None,
+        "ix_responses_form_status_created",
+        id="by form and status",
+    ),
+    pytest.param(ResponseFilter(status=ResponseStatus.SUBMITTED), None, "ix_responses_submitted_created", id="submitted"),
+    pytest.param(ResponseFilter(form_id=FORM_ID), CURSOR, "ix_responses_form_created", id="by form after cursor"),
+]
+
+
+def plan_nodes(plan: dict):
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def capture_list_query(session, filters, after):
+    """Run a list query through the repository and return the SELECT it emitted."""
+    statements = []
+
+    def record(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    event.listen(session.sync_session, "do_orm_execute", record)
+    try:
+        repository = ResponseRepository(session)
+        if after is None:
+            await repository.get_all(limit=20, filters=filters, count_mode=CountMode.NONE)
+        else:
+            await repository.get_all_after(after, limit=20, filters=filters, count_mode=CountMode.NONE)
+    finally:
+        event.remove(session.sync_session, "do_orm_execute", record)
+    return statements[-1]
+
+
+@pytest.mark.parametrize("filters, after, expected_index", LIST_QUERY_SHAPES)
+async def test_list_query_is_ordered_index_scan(filters, after, expected_index):
+    async with AsyncSessionLocal() as session:
+        statement = await capture_list_query(session, filters, after)
+
+        # Small test tables favour sequential scans; the check is about index shape, not cost.
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = await session.scalar(Explain(statement))
+        await session.rollback()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = list(plan_nodes(plan[0]["Plan"]))
+    indexes = {node["Index Name"] for node in nodes if node.get("Index Name")}
+    sorts = [node["Node Type"] for node in nodes if node["Node Type"] in ("Sort", "Incremental Sort")]
+
+    assert expected_index in indexes, f"expected {expected_index}, plan uses {sorted(indexes)}:\n{json.dumps(plan, indent=2)}"
+    assert sorts == [], f"plan sorts instead of reading {expected_index} in order:\n{json.dumps(plan, indent=2)}"